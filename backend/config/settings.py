@@ -68,7 +68,20 @@ VECTOR_DB_CONFIG = {
     'VECTOR_SIZE': 1536,  # OpenAI text-embedding-3-small dimensions
     'TIMEOUT_SECONDS': 30,  # Connection timeout
     'HEALTH_CHECK_THRESHOLD': 0.8,  # 80% of expected documents for health check
-    'INGESTION_TIMEOUT_SECONDS': 300  # 5 minutes timeout for ingestion operations
+    'INGESTION_TIMEOUT_SECONDS': 300,  # 5 minutes timeout for ingestion operations
+    'SCALAR_QUANTIZATION_QUANTILE': 0.99,  # Quantile used to clip outliers when quantizing vectors to int8
+    'QUANTIZATION_OVERSAMPLING': 2.0,  # Candidates fetched via int8 vectors per result before float32 rescoring
+    'QUANTIZE_EXISTING_COLLECTIONS': False,  # Add int8 quantization to existing collections on startup (one-way change)
+    'STATUS_CACHE_TTL_SECONDS': 10  # How long a computed corpus status is reused between corpus changes
+}
+
+SEMANTIC_CACHE_CONFIG = {
+    'NUM_BANDS': 16,  # LSH hash tables; a query hits if it shares any band with a cached one
+    'BITS_PER_BAND': 10,  # Random hyperplanes hashed into each band key
+    'SIMILARITY_THRESHOLD': 0.95,  # Minimum cosine similarity for a cache hit
+    'MAX_ENTRIES': 1000,  # Cached queries kept before LRU eviction
+    'SEED': 42,  # Fixed seed so signatures are stable across restarts
+    'QUERY_EMBEDDING_CACHE_SIZE': 4096  # Query texts whose embeddings are kept in memory
 }
 
 # =============================================================================
@@ -79,7 +92,9 @@ SERVER_CONFIG = {
     'HOST': '0.0.0.0',
     'PORT': 8000,
     'APP_TITLE': 'RagCheck API',
-    'APP_VERSION': '1.0.0'
+    'APP_VERSION': '1.0.0',
+    'GZIP_MINIMUM_SIZE': 1024,  # Only compress responses larger than this many bytes
+    'GZIP_COMPRESS_LEVEL': 5  # Balance compression ratio against CPU per response
 }
 
 # =============================================================================
@@ -121,7 +136,10 @@ COLLECTION_NAMES = {
 EXPERIMENT_CONFIG = {
     'DEFAULT_TOP_K': 5,
     'DEFAULT_SIMILARITY_THRESHOLD': 0.5,
-    'DEFAULT_SELECTED_GROUPS': ['llm', 'ragas']
+    'DEFAULT_SELECTED_GROUPS': ['llm', 'ragas'],
+    'QUESTION_BATCH_SIZE': 8,  # Questions embedded and searched per batched request
+    'MAX_CONCURRENT_SEARCHES': 8,  # Cap on in-flight batched vector searches
+    'STREAMED_CONTENT_PREVIEW_CHARS': 160  # Chunk text streamed per retrieved doc unless full content is requested
 }
 
 # =============================================================================
@@ -132,8 +150,7 @@ MOCK_DATA_CONFIG = {
     'DEFAULT_DOCUMENT_COUNT': 152,
     'DEFAULT_CHUNK_COUNT': 1247,
     'DEFAULT_TOTAL_SIZE_MB': 45.2,
-    'DEFAULT_AVG_DOC_LENGTH': 2400,
-    'SAMPLE_QUESTIONS_COUNT': 3
+    'DEFAULT_AVG_DOC_LENGTH': 2400
 }
 
 # =============================================================================
@@ -1,13 +1,21 @@
 # -*- coding: utf-8 -*-
-from fastapi import FastAPI, WebSocket, UploadFile, File
+from fastapi import FastAPI, Request, WebSocket, UploadFile, File, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.websockets import WebSocketState
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 import traceback
 import asyncio
-import random
 import logging
 import os
+import time
+import orjson
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from types import MappingProxyType
 from logging_config import setup_logging
 # Legacy imports removed - using unified processor instead
 from services.quality_score_service import QualityScoreService
@@ -21,7 +29,6 @@ from config.settings import (
     COLLECTION_NAMES, 
     FILE_CONFIG, 
     EXPERIMENT_CONFIG,
-    MOCK_DATA_CONFIG,
     ERROR_MESSAGES,
     SUCCESS_MESSAGES,
     LOG_MESSAGES,
@@ -32,22 +39,42 @@ from config.settings import (
     CHUNK_OVERLAP
 )
 from datetime import datetime
+from pathlib import Path
 
 # Add new imports for document management
 from unified_document_processor import UnifiedDocumentProcessor
 
+# Resolve backend-relative paths once at import time
+BACKEND_DIR = Path(__file__).resolve().parent
+
+# Load environment variables from root .env file before anything reads them
+load_dotenv(dotenv_path=BACKEND_DIR.parent / '.env')
+
 # Initialize unified document processor (replaces both simple and enhanced)
 unified_doc_processor = UnifiedDocumentProcessor()
 
 # Note: Legacy processors removed to prevent duplicate initialization
 # All functionality now uses unified_doc_processor
 
-# Load environment variables from root .env file
-load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '..', '.env'))
-
 data_folder = os.getenv("DATA_FOLDER", ENV_DEFAULTS['DATA_FOLDER'])
-
-app = FastAPI(title=SERVER_CONFIG['APP_TITLE'], version=SERVER_CONFIG['APP_VERSION'])
+DATA_DIR = BACKEND_DIR / data_folder
+QUESTIONS_DIR = DATA_DIR / FILE_CONFIG['QUESTIONS_SUBFOLDER']
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Check the corpus on startup without blocking import, and clean up on shutdown."""
+    global documents_loaded, main_event_loop
+    main_event_loop = asyncio.get_running_loop()
+    documents_loaded = await asyncio.to_thread(check_startup_document_status)
+    yield
+    await shutdown_event()
+
+app = FastAPI(
+    title=SERVER_CONFIG['APP_TITLE'],
+    version=SERVER_CONFIG['APP_VERSION'],
+    default_response_class=ORJSONResponse,  # orjson serializes dict-heavy payloads much faster than stdlib json
+    lifespan=lifespan
+)
 
 # Set up logging
 logger = setup_logging(__name__)
@@ -55,12 +82,47 @@ logger = setup_logging(__name__)
 # Initialize managers and services
 # Note: doc_processor removed - using unified_doc_processor instead
 # Note: qdrant_manager, data_manager, search_manager removed - using unified_doc_processor instead
-experiment_service = ExperimentService()
+experiment_service = ExperimentService(doc_processor=unified_doc_processor)
 gap_analysis_service = GapAnalysisService()
 documents_loaded = False
 
+class ExperimentResultsStore:
+    """Lock-guarded container for the currently loaded experiment results."""
+    
+    def __init__(self):
+        self._results: List[Dict[str, Any]] = []
+        self._version = 0
+        self._lock = asyncio.Lock()
+    
+    async def snapshot(self) -> List[Dict[str, Any]]:
+        """Return a copy of the current results that is safe to iterate."""
+        async with self._lock:
+            return self._results.copy()
+    
+    async def versioned_snapshot(self) -> Tuple[int, List[Dict[str, Any]]]:
+        """Return the results version (bumped on every replace) with a copy of the results."""
+        async with self._lock:
+            return self._version, self._results.copy()
+    
+    async def preview(self, limit: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """Return the number of results with the first few of them, without copying the full list."""
+        async with self._lock:
+            return len(self._results), self._results[:limit]
+    
+    async def replace(self, results: List[Dict[str, Any]]) -> None:
+        """Atomically replace the current results."""
+        async with self._lock:
+            self._results = list(results)
+            self._version += 1
+    
+    async def clear(self) -> None:
+        """Remove all current results."""
+        await self.replace([])
+
+# Experiment results shared by the HTTP endpoints and the experiment WebSocket
+app.state.experiment_results = ExperimentResultsStore()
+
 # Global variables for experiment state
-experiment_results = []
 current_loaded_experiment = None
 current_selected_documents = []  # Store selected documents for chunk coverage calculation
 current_total_selected_chunks = 0  # Store total chunks count for selected documents
@@ -68,53 +130,76 @@ current_total_selected_chunks = 0  # Store total chunks count for selected docum
 # Progress tracking for long-running operations
 ingestion_progress = {}
 
+# Set (and replaced) whenever ingestion progress changes, waking every progress WebSocket
+ingestion_progress_changed = asyncio.Event()
+# Event loop serving requests, set on startup; ingestion threads schedule callbacks on it thread-safely
+main_event_loop = None
+
+# Document ingestions, bulk ingestions and collection rebuilds run here rather than in the default
+# executor, so long-running ingestions cannot tie up the threads request handlers use. A single
+# worker because ingestions must not overlap each other or a rebuild of the collection they write to.
+ingestion_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingestion")
+
+# Background experiment saves by filename, awaited before that file is read and on shutdown
+pending_experiment_saves: Dict[str, asyncio.Task] = {}
+
+# Serializes corpus rebuilds and bulk ingestions so concurrent requests cannot rebuild the
+# collection while another request is rebuilding or bulk-ingesting into it
+corpus_rebuild_lock = asyncio.Lock()
+
 # Don't automatically load experiment on startup - let users explicitly load what they want
 # experiment_results = experiment_service.load_experiment_results()
 
-# Try to load documents on startup using unified processor
-try:
-    logger.info(LOG_MESSAGES['INIT_DOC_PROCESSING'])
-    
-    # Use unified processor to check status and initialize if needed
-    unified_status = unified_doc_processor.get_unified_status()
+def check_startup_document_status() -> bool:
+    """
+    Check whether the corpus is already loaded, using the unified processor.
+    Runs in a worker thread during application startup.
     
-    if unified_status.get("corpus_loaded", False):
-        documents_loaded = True
-        logger.info(LOG_MESSAGES['DOC_PROCESSING_SUCCESS'])
+    Returns:
+        True if documents are loaded, otherwise False (mock data fallback)
+    """
+    try:
+        logger.info(LOG_MESSAGES['INIT_DOC_PROCESSING'])
+        
+        # Use unified processor to check status and initialize if needed
+        unified_status = unified_doc_processor.get_unified_status()
+        
+        if unified_status.get("corpus_loaded", False):
+            logger.info(LOG_MESSAGES['DOC_PROCESSING_SUCCESS'])
+            
+            # Check if vector store is already populated
+            if unified_status.get("chunk_count", 0) > 0:
+                logger.info(f"📦 Vector store already populated with {unified_status.get('chunk_count', 0)} chunks, skipping document reload")
+                logger.info(LOG_MESSAGES['VECTOR_STORE_SUCCESS'])
+            else:
+                logger.info("📥 Vector store empty, but unified processor will handle initialization when needed")
+                logger.info(LOG_MESSAGES['VECTOR_STORE_SUCCESS'])
+            return True
         
-        # Check if vector store is already populated
-        if unified_status.get("chunk_count", 0) > 0:
-            logger.info(f"📦 Vector store already populated with {unified_status.get('chunk_count', 0)} chunks, skipping document reload")
-            logger.info(LOG_MESSAGES['VECTOR_STORE_SUCCESS'])
-        else:
-            logger.info("📥 Vector store empty, but unified processor will handle initialization when needed")
-            logger.info(LOG_MESSAGES['VECTOR_STORE_SUCCESS'])
-    else:
         logger.warning(LOG_MESSAGES['MOCK_DATA_FALLBACK'])
-except Exception as e:
-    logger.error(f"❌ {ERROR_MESSAGES['DOCUMENT_PROCESSING_FAILED']}: {str(e)}")
-    logger.error(traceback.format_exc())
-    logger.info(LOG_MESSAGES['DOC_PROCESSING_FALLBACK'])
-
-# Configure CORS for both local and Vercel deployments
-cors_origins = CORS_CONFIG['DEFAULT_ORIGINS'].copy()
-
-# Add production frontend URLs from environment
-frontend_url = os.getenv("FRONTEND_URL")
-if frontend_url and frontend_url not in cors_origins:
-    cors_origins.append(frontend_url)
-
-# Add Vercel frontend URL from environment
-vercel_frontend_url = os.getenv("VERCEL_FRONTEND_URL")
-if vercel_frontend_url and vercel_frontend_url not in cors_origins:
-    cors_origins.append(vercel_frontend_url)
-
-# Add any additional Vercel domains from environment
-vercel_domain = os.getenv("VERCEL_DOMAIN")
-if vercel_domain and vercel_domain not in cors_origins:
-    cors_origins.append(vercel_domain)
-
-logger.info(f"🌐 {LOG_MESSAGES['CORS_CONFIGURED']}: {cors_origins}")
+        return False
+    except Exception as e:
+        logger.error(f"❌ {ERROR_MESSAGES['DOCUMENT_PROCESSING_FAILED']}: {str(e)}")
+        logger.error(traceback.format_exc())
+        logger.info(LOG_MESSAGES['DOC_PROCESSING_FALLBACK'])
+        return False
+
+# Configure CORS for both local and Vercel deployments:
+# defaults plus production frontend URL, Vercel frontend URL and any additional Vercel domain
+cors_origin_list = list(dict.fromkeys(
+    origin for origin in (
+        *CORS_CONFIG['DEFAULT_ORIGINS'],
+        os.getenv("FRONTEND_URL"),
+        os.getenv("VERCEL_FRONTEND_URL"),
+        os.getenv("VERCEL_DOMAIN"),
+    )
+    if origin
+))
+
+logger.info(f"🌐 {LOG_MESSAGES['CORS_CONFIGURED']}: {cors_origin_list}")
+
+# Frozen once so the middleware's per-request origin check is a set lookup
+cors_origins = frozenset(cors_origin_list)
 
 app.add_middleware(
     CORSMiddleware,
@@ -124,10 +209,61 @@ app.add_middleware(
     allow_headers=CORS_CONFIG['ALLOW_HEADERS'],
 )
 
+# Compress large JSON responses (chunk lists, questions, analysis results)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=SERVER_CONFIG['GZIP_MINIMUM_SIZE'],
+    compresslevel=SERVER_CONFIG['GZIP_COMPRESS_LEVEL'],
+)
+
+# Qdrant probe cache shared by /health, /api/database/status and /api/corpus/status.
+# Each probe is a network round-trip, so results are reused for a few seconds.
+QDRANT_PROBE_TTL_SECONDS = 5
+_qdrant_probe_cache: Dict[str, Any] = {"result": None, "timestamp": 0.0}
+_qdrant_probe_lock = asyncio.Lock()
+
+async def _probe_qdrant() -> Dict[str, Any]:
+    """Run the Qdrant connectivity and collection probes on the async client."""
+    qdrant_manager = unified_doc_processor.qdrant_manager
+    try:
+        collections = await qdrant_manager.async_client.get_collections()
+        vector_count = 0
+        if any(c.name == qdrant_manager.collection_name for c in collections.collections):
+            collection_info = await qdrant_manager.async_client.get_collection(qdrant_manager.collection_name)
+            vector_count = collection_info.points_count or 0
+        return {"connected": True, "vector_count": vector_count, "error": None}
+    except Exception as e:
+        logger.warning(f"⚠️ Database connectivity issue: {e}")
+        return {"connected": False, "vector_count": 0, "error": str(e)}
+
+async def get_qdrant_status() -> Dict[str, Any]:
+    """Get Qdrant connectivity status, probing the server at most once per TTL window."""
+    async with _qdrant_probe_lock:
+        cached = _qdrant_probe_cache["result"]
+        if cached is not None and time.monotonic() - _qdrant_probe_cache["timestamp"] < QDRANT_PROBE_TTL_SECONDS:
+            return cached
+        
+        result = await _probe_qdrant()
+        _qdrant_probe_cache["result"] = result
+        _qdrant_probe_cache["timestamp"] = time.monotonic()
+        return result
+
+# Serialized /health payload, rebuilt at most once per Qdrant probe TTL window
+_health_response_cache: Dict[str, Any] = {"body": None, "timestamp": 0.0}
+
 # Health check endpoint for Docker and service monitoring
 @app.get("/health")
 async def health_check():
     """Comprehensive health check endpoint for Docker service monitoring."""
+    if (_health_response_cache["body"] is None or
+            time.monotonic() - _health_response_cache["timestamp"] >= QDRANT_PROBE_TTL_SECONDS):
+        _health_response_cache["body"] = orjson.dumps(await build_health_status())
+        _health_response_cache["timestamp"] = time.monotonic()
+    
+    return Response(content=_health_response_cache["body"], media_type="application/json")
+
+async def build_health_status() -> Dict[str, Any]:
+    """Build the health status payload from the current service checks."""
     health_status = {
         "status": "healthy",
         "timestamp": datetime.utcnow().isoformat() + "Z",
@@ -135,22 +271,19 @@ async def health_check():
     }
     
     # Check Qdrant connection
-    try:
-        # Use the existing method to test connection
-        collection_info = unified_doc_processor.qdrant_manager.get_collection_info()
-        vector_count = collection_info.get('vector_count', 0)
-        
+    qdrant_status = await get_qdrant_status()
+    if qdrant_status["connected"]:
         health_status["services"]["qdrant"] = {
             "status": "healthy",
             "connected": True,
-            "vector_count": vector_count,
+            "vector_count": qdrant_status["vector_count"],
             "collection": unified_doc_processor.qdrant_manager.collection_name
         }
-    except Exception as e:
+    else:
         health_status["services"]["qdrant"] = {
             "status": "unhealthy", 
             "connected": False,
-            "error": str(e)
+            "error": qdrant_status["error"]
         }
         health_status["status"] = "unhealthy"
     
@@ -162,13 +295,16 @@ async def health_check():
     }
     
     # Check data folder
-    data_path = os.path.join(os.path.dirname(__file__), data_folder)
+    data_exists = DATA_DIR.exists()
     health_status["services"]["data"] = {
-        "status": "available" if os.path.exists(data_path) else "missing",
-        "path": data_path,
-        "exists": os.path.exists(data_path)
+        "status": "available" if data_exists else "missing",
+        "path": str(DATA_DIR),
+        "exists": data_exists
     }
     
+    # Semantic search cache effectiveness
+    health_status["semantic_cache"] = unified_doc_processor.semantic_cache.get_stats()
+    
     # Overall status determination
     service_statuses = [service["status"] for service in health_status["services"].values()]
     if "unhealthy" in service_statuses or "missing" in service_statuses:
@@ -181,30 +317,26 @@ async def health_check():
 @app.get("/api/database/status")
 async def get_database_status():
     """Get database connectivity status specifically for the frontend status indicator."""
-    try:
-        # Check Qdrant connection
-        collection_info = unified_doc_processor.qdrant_manager.get_collection_info()
-        vector_count = collection_info.get('vector_count', 0)
-        
+    # Check Qdrant connection
+    qdrant_status = await get_qdrant_status()
+    if qdrant_status["connected"]:
         return {
             "success": True,
             "database_connected": True,
             "qdrant_status": "connected",
-            "vector_count": vector_count,
+            "vector_count": qdrant_status["vector_count"],
             "collection": unified_doc_processor.qdrant_manager.collection_name,
             "timestamp": datetime.utcnow().isoformat() + "Z"
         }
-    except Exception as e:
-        logger.warning(f"⚠️ Database connectivity check failed: {e}")
-        return {
-            "success": True,
-            "database_connected": False,
-            "qdrant_status": "disconnected",
-            "error": str(e),
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-
-import json
+    
+    logger.warning(f"⚠️ Database connectivity check failed: {qdrant_status['error']}")
+    return {
+        "success": True,
+        "database_connected": False,
+        "qdrant_status": "disconnected",
+        "error": qdrant_status["error"],
+        "timestamp": datetime.utcnow().isoformat() + "Z"
+    }
 
 # Fallback mock data
 MOCK_CORPUS_STATUS = {
@@ -219,7 +351,7 @@ MOCK_CORPUS_STATUS = {
     }
 }
 
-def load_questions_from_file(filename: str) -> Dict[str, Any]:
+def load_questions_from_file(filename: Union[str, Path]) -> Dict[str, Any]:
     """
     Load questions from a JSON file.
     
@@ -231,31 +363,27 @@ def load_questions_from_file(filename: str) -> Dict[str, Any]:
     """
     try:
         logger.info(f"Started loading questions from {filename}")
-        with open(filename, 'r', encoding='utf-8-sig') as f:
-            questions_data = json.load(f)
+        with open(filename, 'rb') as f:
+            raw = f.read()
+        # orjson does not accept a UTF-8 BOM, so strip it like 'utf-8-sig' did
+        questions_data = orjson.loads(raw.removeprefix(b'\xef\xbb\xbf'))
         
         # Restructure the data to match the original format
-        all_questions = []
-        roles = []
-        for role_item in questions_data:
-            roles.append(role_item["role"])
-            for question in role_item["questions"]:
-                all_questions.append(question["text"])
-
-        logger.info(f"Loaded {len(all_questions)} questions.")
+        roles = [role_item["role"] for role_item in questions_data]
+        count = sum(len(role_item["questions"]) for role_item in questions_data)
+
+        logger.info(f"Loaded {count} questions.")
         logger.info(f"...finished loading questions from {filename}.")
 
         return {
-            "count": len(all_questions),
-            "sample": random.sample(all_questions, min(len(all_questions), 3)),
+            "count": count,
             "roles": roles,
             "questions": questions_data
         }        
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (FileNotFoundError, orjson.JSONDecodeError) as e:
         logger.error(f"Error loading questions from {filename}: {e}")
         return {
             "count": 0,
-            "sample": [],
             "roles": [],
             "questions": []
         }
@@ -263,14 +391,56 @@ def load_questions_from_file(filename: str) -> Dict[str, Any]:
 logger.info(f"📁 Data folder: {data_folder}")
 
 # Load LLM questions from the JSON file
-LLM_QUESTIONS = load_questions_from_file(
-    os.path.join(os.path.dirname(__file__), data_folder, FILE_CONFIG['QUESTIONS_SUBFOLDER'], FILE_CONFIG['LLM_QUESTIONS_FILE'])
-)
+LLM_QUESTIONS = load_questions_from_file(QUESTIONS_DIR / FILE_CONFIG['LLM_QUESTIONS_FILE'])
 
 # Load RAGAS questions from the JSON file
-RAGAS_QUESTIONS = load_questions_from_file(
-    os.path.join(os.path.dirname(__file__), data_folder, FILE_CONFIG['QUESTIONS_SUBFOLDER'], FILE_CONFIG['RAGAS_QUESTIONS_FILE'])
-)
+RAGAS_QUESTIONS = load_questions_from_file(QUESTIONS_DIR / FILE_CONFIG['RAGAS_QUESTIONS_FILE'])
+
+# Question lists never change after startup, so serialize them once and serve the bytes directly
+LLM_QUESTIONS_BYTES = orjson.dumps(LLM_QUESTIONS["questions"])
+RAGAS_QUESTIONS_BYTES = orjson.dumps(RAGAS_QUESTIONS["questions"])
+
+# Strong ETags let browsers revalidate the question lists with a 304 instead of re-downloading them
+LLM_QUESTIONS_ETAG = f'"{hashlib.md5(LLM_QUESTIONS_BYTES).hexdigest()}"'
+RAGAS_QUESTIONS_ETAG = f'"{hashlib.md5(RAGAS_QUESTIONS_BYTES).hexdigest()}"'
+
+def cached_json_response(request: Request, content: bytes, etag: str) -> Response:
+    """
+    Serve pre-serialized JSON with an ETag, answering 304 when the client already has it.
+    
+    Args:
+        request: Incoming request, checked for If-None-Match
+        content: Serialized JSON body
+        etag: Quoted strong ETag for the body
+        
+    Returns:
+        304 response if the ETag matches, otherwise the JSON body
+    """
+    # Question files only change on redeploy, so let clients keep them but always revalidate
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag using weak comparison (RFC 9110).
+    
+    Args:
+        if_none_match: Header value: "*" or a comma-separated list of possibly weak (W/) ETags
+        etag: Quoted strong ETag for the body
+        
+    Returns:
+        True if the header lists the ETag or is "*"
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
 
 
 
@@ -279,41 +449,28 @@ class ExperimentConfig(BaseModel):
     selected_groups: List[str]
     top_k: int = EXPERIMENT_CONFIG['DEFAULT_TOP_K']
     similarity_threshold: float = EXPERIMENT_CONFIG['DEFAULT_SIMILARITY_THRESHOLD']  # Keep internal processing in 0-1 scale
-
-class QuestionResult(BaseModel):
-    question_id: str
-    question: str
-    source: str
-    avg_similarity: float  # Internal processing still uses similarity
-    retrieved_docs: List[Dict[str, Any]]
+    include_content: bool = False  # Stream full chunk text instead of a preview (saved results always keep it)
 
 # API Endpoints
 @app.get("/api/corpus/status")
 async def get_corpus_status():
     """Get corpus status - real data if available, otherwise mock data."""
     
-    # Check database connectivity
-    database_connected = False
+    # Check database connectivity using the shared probe cache
     database_error = None
-    
-    try:
-        # Test Qdrant connection using unified processor
-        database_connected = unified_doc_processor._check_database_connectivity()
-        if database_connected:
-            logger.info("✅ Database connectivity verified")
-        else:
-            database_error = "Database connectivity check failed"
-            logger.warning("⚠️ Database connectivity issue")
-    except Exception as e:
-        database_connected = False
-        database_error = str(e)
-        logger.warning(f"⚠️ Database connectivity issue: {e}")
+    qdrant_status = await get_qdrant_status()
+    database_connected = qdrant_status["connected"]
+    if database_connected:
+        logger.info("✅ Database connectivity verified")
+    else:
+        database_error = qdrant_status["error"]
+        logger.warning(f"⚠️ Database connectivity issue: {database_error}")
     
     if documents_loaded and database_connected:
         # Use unified document processor to get comprehensive status
         try:
             # Get unified status (includes both corpus and selection information)
-            unified_status = unified_doc_processor.get_unified_status()
+            unified_status = await asyncio.to_thread(unified_doc_processor.get_unified_status)
             
             # Return in the format expected by the frontend
             corpus_stats = {
@@ -335,7 +492,7 @@ async def get_corpus_status():
             logger.error(f"❌ Failed to get unified corpus status: {e}")
             # Fallback to unified processor with error handling
             try:
-                corpus_stats = unified_doc_processor.get_corpus_stats()
+                corpus_stats = await asyncio.to_thread(unified_doc_processor.get_corpus_stats)
                 corpus_stats["database_connected"] = True
                 corpus_stats["database_error"] = None
                 return corpus_stats
@@ -355,7 +512,7 @@ async def get_corpus_status():
         # Check if we have tracked documents (even if not ingested)
         try:
             # Try to get document status even if corpus isn't fully loaded
-            document_status = unified_doc_processor.get_document_status()
+            document_status = await asyncio.to_thread(unified_doc_processor.get_document_status)
             if document_status and document_status.get("documents"):
                 # We have tracked documents, return their status
                 logger.info(f"📋 Database connected, returning tracked document status: {len(document_status.get('documents', []))} documents")
@@ -399,14 +556,46 @@ async def get_corpus_status():
         "error_message": "No documents loaded or database not connected"
     }
 
+# Experiment configuration values are settings constants, so serialize them once
+EXPERIMENT_CONFIG_BYTES = orjson.dumps({
+    "chunk_strategy": CHUNK_STRATEGY,
+    "retrieval_method": RETRIEVAL_METHOD,
+    "chunk_size": CHUNK_SIZE,
+    "chunk_overlap": CHUNK_OVERLAP,
+})
+
 @app.get("/api/v1/experiment/config")
 async def get_experiment_config():
     """Get experiment configuration values."""
+    return Response(content=EXPERIMENT_CONFIG_BYTES, media_type="application/json")
+
+async def scroll_chunk_batch(qdrant_manager, offset, batch_size: int):
+    """Fetch one page of chunk payloads from the Qdrant collection."""
+    return await qdrant_manager.async_client.scroll(
+        collection_name=qdrant_manager.collection_name,
+        limit=batch_size,
+        offset=offset,
+        with_payload=True,
+        with_vectors=False  # Don't need vectors for metadata
+    )
+
+# Shared read-only default for points missing a payload or metadata, so misses don't allocate
+EMPTY_MAPPING = MappingProxyType({})
+
+def build_chunk_data(point) -> Dict[str, Any]:
+    """Build the heatmap chunk summary for a Qdrant point."""
+    payload = point.payload or EMPTY_MAPPING
+    # Extract metadata from nested structure
+    metadata = payload.get("metadata") or EMPTY_MAPPING
+    page_content = payload.get("page_content") or ""
+    
     return {
-        "chunk_strategy": CHUNK_STRATEGY,
-        "retrieval_method": RETRIEVAL_METHOD,
-        "chunk_size": CHUNK_SIZE,
-        "chunk_overlap": CHUNK_OVERLAP,
+        # Use descriptive chunk_id from payload instead of numeric point.id
+        "chunk_id": payload.get("chunk_id", str(point.id)),
+        # Use pre-stored processed metadata (doc_id, title) from chunk enhancement
+        "doc_id": metadata.get("doc_id", "unknown"),
+        "title": metadata.get("title", "Unknown Document"),
+        "content": page_content[:200] + "..." if len(page_content) > 200 else page_content
     }
 
 @app.get("/api/corpus/chunks")
@@ -424,60 +613,61 @@ async def get_all_chunks():
                 "status": "error"
             }
         
-        # Get all points from Qdrant collection using unified processor
-        qdrant_stats = unified_doc_processor.qdrant_manager.get_document_statistics()
-        total_points = qdrant_stats.get("total_chunks", 0)
+        # Count points in the Qdrant collection without blocking the event loop
+        qdrant_manager = unified_doc_processor.qdrant_manager
+        count_result = await qdrant_manager.async_client.count(
+            collection_name=qdrant_manager.collection_name,
+            exact=True
+        )
+        total_points = count_result.count
         
         if total_points == 0:
             logger.warning("⚠️ No chunks found in vector database")
             return {"chunks": [], "total_count": 0}
         
-        # Scroll through all points in the collection
-        all_chunks = []
-        offset = None
+        # Fetch the first batch up front so connection errors still produce a normal error response
         batch_size = 100
-        
-        while True:
-            scroll_result = unified_doc_processor.qdrant_manager.client.scroll(
-                collection_name=unified_doc_processor.qdrant_manager.collection_name,
-                limit=batch_size,
-                offset=offset,
-                with_payload=True,
-                with_vectors=False  # Don't need vectors for metadata
-            )
-            
-            points, next_offset = scroll_result
-            if not points:
-                break
-                
-            for point in points:
-                # Extract metadata from nested structure
-                metadata = point.payload.get("metadata", {})
-                
-                # Use pre-stored processed metadata (doc_id, title) from chunk enhancement
-                doc_id = metadata.get("doc_id", "unknown")
-                title = metadata.get("title", "Unknown Document")
-                
-                # Use descriptive chunk_id from payload instead of numeric point.id
-                chunk_id = point.payload.get("chunk_id", str(point.id))
-                
-                chunk_data = {
-                    "chunk_id": chunk_id,
-                    "doc_id": doc_id,
-                    "title": title,
-                    "content": point.payload.get("page_content", "")[:200] + "..." if len(point.payload.get("page_content", "")) > 200 else point.payload.get("page_content", "")
-                }
-                all_chunks.append(chunk_data)
+        points, next_offset = await scroll_chunk_batch(qdrant_manager, None, batch_size)
+        
+        async def stream_chunks():
+            """Serialize each scroll batch as it arrives instead of building the full list."""
+            nonlocal points, next_offset
+            total_count = 0
+            error = None
+            next_page = None
+            yield b'{"chunks":['
+            try:
+                while points:
+                    # Request the next page before sending this one so the Qdrant round-trip overlaps the send
+                    if next_offset is not None:
+                        next_page = asyncio.create_task(scroll_chunk_batch(qdrant_manager, next_offset, batch_size))
+                    
+                    # One write per scroll batch keeps peak memory at batch_size chunks
+                    batch = b','.join(orjson.dumps(build_chunk_data(point)) for point in points)
+                    yield (b',' if total_count else b'') + batch
+                    total_count += len(points)
+                    
+                    if next_page is None:
+                        break
+                    points, next_offset = await next_page
+                    next_page = None
+            except Exception as e:
+                # Headers are already sent, so close the JSON document and report the partial result
+                logger.error(f"❌ Chunk streaming stopped after {total_count} chunks: {e}")
+                error = str(e)
+            finally:
+                # Client disconnected mid-stream: don't leave a scroll request running
+                if next_page is not None:
+                    next_page.cancel()
             
-            if next_offset is None:
-                break
-            offset = next_offset
+            tail = {"total_count": total_count}
+            if error:
+                tail.update({"status": "error", "error": error})
+            else:
+                logger.info(f"📊 Retrieved {total_count} chunks from vector database")
+            yield b'],' + orjson.dumps(tail)[1:]
         
-        logger.info(f"📊 Retrieved {len(all_chunks)} chunks from vector database")
-        return {
-            "chunks": all_chunks,
-            "total_count": len(all_chunks)
-        }
+        return StreamingResponse(stream_chunks(), media_type="application/json")
         
     except Exception as e:
         error_response = ErrorResponseService.log_and_return_error(
@@ -494,12 +684,12 @@ async def get_all_chunks():
         return error_response
 
 @app.get("/api/questions/llm")
-async def get_llm_questions():
-    return LLM_QUESTIONS["questions"]
+async def get_llm_questions(request: Request):
+    return cached_json_response(request, LLM_QUESTIONS_BYTES, LLM_QUESTIONS_ETAG)
 
 @app.get("/api/questions/ragas")
-async def get_ragas_questions():
-    return RAGAS_QUESTIONS["questions"]
+async def get_ragas_questions(request: Request):
+    return cached_json_response(request, RAGAS_QUESTIONS_BYTES, RAGAS_QUESTIONS_ETAG)
 
 @app.post("/api/experiment/run")
 async def run_experiment(config: ExperimentConfig):
@@ -514,14 +704,22 @@ async def run_experiment(config: ExperimentConfig):
         "experiment_id": "exp_001",
         "total_questions": total_questions,
         "status": "running",
-        "config": config.dict()
+        "config": config.model_dump(mode="json")
     }
 
+# Serialized analysis response, keyed by results version and chunk coverage inputs
+_analysis_response_cache = {"key": None, "content": None}
+
 @app.get("/api/results/analysis")
 async def get_analysis_results():
     """Get analysis results from the currently loaded experiment."""
-    global experiment_results, current_loaded_experiment, current_selected_documents, current_total_selected_chunks
+    global current_loaded_experiment, current_selected_documents, current_total_selected_chunks
+    
+    # A just-completed experiment's selected documents and chunk total arrive with its background save
+    if current_loaded_experiment:
+        await wait_for_experiment_save(current_loaded_experiment)
     
+    results_version, experiment_results = await app.state.experiment_results.versioned_snapshot()
     if not experiment_results:
         logger.warning("⚠️ No experiment loaded, returning empty analysis")
         return {
@@ -539,23 +737,34 @@ async def get_analysis_results():
             "per_question": []
         }
     
-    logger.info(f"📊 Analyzing {len(experiment_results)} experiment results")
+    # The analysis only changes when the results or the chunk coverage inputs do. Without a saved
+    # chunk total, coverage falls back to a live Qdrant count, so that case is never cached.
+    cache_key = (results_version, tuple(current_selected_documents or ()), current_total_selected_chunks)
+    if not current_total_selected_chunks or _analysis_response_cache["key"] != cache_key:
+        logger.info(f"📊 Analyzing {len(experiment_results)} experiment results")
+        
+        # Convert experiment results to analysis format
+        per_question_results = experiment_service.convert_experiment_results_to_analysis(experiment_results)
+        
+        # Calculate analysis metrics with selected documents and chunk count for chunk coverage
+        analysis_response = experiment_service.build_analysis_response(per_question_results, current_selected_documents, current_total_selected_chunks)
+        # Same NumPy handling ORJSONResponse applies, since metrics may carry NumPy scalars
+        _analysis_response_cache["content"] = orjson.dumps(analysis_response, option=orjson.OPT_SERIALIZE_NUMPY)
+        _analysis_response_cache["key"] = cache_key if current_total_selected_chunks else None
     
-    # Convert experiment results to analysis format
-    per_question_results = experiment_service.convert_experiment_results_to_analysis(experiment_results)
-    
-    # Calculate and return analysis metrics with selected documents and chunk count for chunk coverage
-    return experiment_service.build_analysis_response(per_question_results, current_selected_documents, current_total_selected_chunks)
+    return Response(content=_analysis_response_cache["content"], media_type="application/json")
 
 @app.get("/api/v1/analysis/status")
 async def get_analysis_status():
     """Get current analysis status and loaded experiment info."""
-    global experiment_results, current_loaded_experiment
+    global current_loaded_experiment
     
+    # Only the count and a two-result sample are reported, so skip copying the full results list
+    experiment_count, experiment_sample = await app.state.experiment_results.preview(2)
     return {
-        "experiment_loaded": len(experiment_results) > 0 if experiment_results else False,
-        "experiment_count": len(experiment_results) if experiment_results else 0,
-        "experiment_sample": experiment_results[:2] if experiment_results and len(experiment_results) > 0 else None,
+        "experiment_loaded": experiment_count > 0,
+        "experiment_count": experiment_count,
+        "experiment_sample": experiment_sample or None,
         "current_experiment": current_loaded_experiment,
         "timestamp": datetime.now().isoformat()
     }
@@ -563,7 +772,7 @@ async def get_analysis_status():
 @app.get("/api/v1/analysis/gaps")
 async def get_gap_analysis():
     """Get gap analysis and recommendations based on current experiment results."""
-    global experiment_results
+    experiment_results = await app.state.experiment_results.snapshot()
     
     try:
         # Try to get the most recent experiment results
@@ -573,7 +782,8 @@ async def get_gap_analysis():
         if experiment_results:
             results_to_analyze = experiment_results
             logger.info(f"✅ Using loaded experiment results: {len(experiment_results)} questions")
-            logger.debug(f"📊 Loaded experiment results sample: {experiment_results[:2] if len(experiment_results) > 0 else 'empty'}")
+            # Lazy %-formatting: the sample is only rendered when debug logging is enabled
+            logger.debug("📊 Loaded experiment results sample: %s", experiment_results[:2])
         else:
             logger.warning("⚠️ No experiment loaded for gap analysis")
                 
@@ -585,12 +795,12 @@ async def get_gap_analysis():
         
         logger.info(f"🔍 Performing gap analysis on {len(results_to_analyze)} experiment results")
         
-        # Debug: Check data format
-        if results_to_analyze and len(results_to_analyze) > 0:
+        # Debug: Check data format (skipped entirely unless debug logging is enabled)
+        if logger.isEnabledFor(logging.DEBUG):
             sample_result = results_to_analyze[0]
-            logger.debug(f"📊 Sample result keys: {list(sample_result.keys())}")
-            logger.debug(f"📊 Sample result has avg_quality_score: {'avg_quality_score' in sample_result}")
-            logger.debug(f"📊 Sample result has role_name: {'role_name' in sample_result}")
+            logger.debug("📊 Sample result keys: %s", list(sample_result.keys()))
+            logger.debug("📊 Sample result has avg_quality_score: %s", 'avg_quality_score' in sample_result)
+            logger.debug("📊 Sample result has role_name: %s", 'role_name' in sample_result)
         
         # Run gap analysis using the rule-based approach
         gap_analysis = gap_analysis_service.analyze_gaps(results_to_analyze)
@@ -610,18 +820,20 @@ async def get_gap_analysis():
 @app.post("/api/results/clear")
 async def clear_experiment_results():
     """Clear stored experiment results."""
-    global experiment_results, current_loaded_experiment, current_selected_documents, current_total_selected_chunks
+    global current_loaded_experiment, current_selected_documents, current_total_selected_chunks
     
     try:
-        experiment_results.clear()
+        await app.state.experiment_results.clear()
         current_loaded_experiment = None
         current_selected_documents = []
         current_total_selected_chunks = 0
         
         # Also delete the file
-        results_file = os.path.join(os.path.dirname(__file__), 'experiment_results.json')
-        if os.path.exists(results_file):
+        results_file = BACKEND_DIR / FILE_CONFIG['EXPERIMENT_RESULTS_FILE']
+        try:
             os.remove(results_file)
+        except FileNotFoundError:
+            pass
         
         logger.info("🗑️ Cleared experiment results")
         return ErrorResponseService.create_success_response("Experiment results cleared")
@@ -637,8 +849,6 @@ async def clear_experiment_results():
 @app.post("/api/results/test")
 async def set_test_results():
     """Set test results for debugging (development only)."""
-    global experiment_results
-    
     # Create some test results with role data (keeping similarity format for internal processing)
     test_results = [
         {
@@ -687,8 +897,10 @@ async def set_test_results():
         }
     ]
     
-    experiment_results = test_results
-    experiment_service.save_experiment_results(experiment_results, {"config": {"top_k": 5, "similarity_threshold": 0.5}})
+    await app.state.experiment_results.replace(test_results)
+    await asyncio.to_thread(
+        experiment_service.save_experiment_results, test_results, {"config": {"top_k": 5, "similarity_threshold": 0.5}}
+    )
     
     logger.info("🧪 Set test experiment results")
     return {"success": True, "message": "Test results set", "count": len(test_results)}
@@ -697,7 +909,11 @@ async def set_test_results():
 async def list_experiments():
     """List all available experiment files."""
     try:
-        experiment_files = experiment_service.list_experiment_files()
+        # Include experiments whose files are still being saved in the background
+        await wait_for_experiment_save()
+        
+        # Parses every experiment file, so keep it off the event loop
+        experiment_files = await asyncio.to_thread(experiment_service.list_experiment_files)
         logger.info(f"📋 Listed {len(experiment_files)} experiment files")
         return {
             "success": True,
@@ -713,40 +929,71 @@ async def list_experiments():
         error_response["experiments"] = []  # Maintain backward compatibility
         return error_response
 
+def read_experiment_file(filepath: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Read a saved experiment file as plain dicts.
+    
+    Experiment files are written by this backend, so they are trusted and parsed
+    with orjson without any model validation.
+    
+    Args:
+        filepath: Path to the experiment JSON file
+        
+    Returns:
+        The parsed experiment data
+    """
+    with open(filepath, 'rb') as f:
+        return orjson.loads(f.read())
+
+def is_valid_experiment_filename(filename: str) -> bool:
+    """
+    Check that a client-supplied experiment filename names a plain JSON file in the experiments folder.
+    
+    Rejects path separators and leading dots, so traversal attempts are turned away without touching the filesystem.
+    """
+    return (
+        filename.endswith('.json')
+        and len(filename) < 256
+        and not filename.startswith('.')
+        and '/' not in filename
+        and '\\' not in filename
+    )
+
+def invalid_experiment_filename_error(filename: str) -> Dict[str, Any]:
+    """Build the validation error returned for a rejected experiment filename."""
+    return ErrorResponseService.validation_error(
+        message="Invalid experiment filename",
+        details=filename[:256]
+    )
+
 @app.post("/api/experiments/load")
 async def load_experiment(filename: str):
     """Load a specific experiment file."""
-    global experiment_results, current_loaded_experiment, current_selected_documents, current_total_selected_chunks
+    global current_loaded_experiment, current_selected_documents, current_total_selected_chunks
     
     try:
         # Load the full experiment data to get metadata
-        import os
-        import json
-        # Use environment variable for experiments folder, fallback to relative path
-        experiments_folder = os.getenv("EXPERIMENTS_FOLDER", "experiments/")
-        if experiments_folder.startswith("/"):
-            experiments_folder = experiments_folder
-        else:
-            experiments_folder = os.path.join(os.getcwd(), experiments_folder)
-        filepath = os.path.join(experiments_folder, filename)
+        if not is_valid_experiment_filename(filename):
+            return invalid_experiment_filename_error(filename)
+        filepath = os.path.join(experiment_service.experiments_folder, filename)
         
-        if not os.path.exists(filepath):
+        # Load full experiment data once a save of a just-completed experiment has landed
+        await wait_for_experiment_save(filename)
+        try:
+            experiment_data = await asyncio.to_thread(read_experiment_file, filepath)
+        except FileNotFoundError:
             return ErrorResponseService.not_found_error(
                 resource="Experiment file",
                 identifier=filename
             )
         
-        # Load full experiment data
-        with open(filepath, 'r') as f:
-            experiment_data = json.load(f)
-        
         # Extract question results and selected documents
         results = experiment_data.get("question_results", [])
         selected_documents = experiment_data.get("metadata", {}).get("selected_documents", [])
         total_selected_chunks = experiment_data.get("metadata", {}).get("total_selected_chunks", 0)
         
         if results:
-            experiment_results = results
+            await app.state.experiment_results.replace(results)
             current_loaded_experiment = filename
             current_selected_documents = selected_documents
             current_total_selected_chunks = total_selected_chunks
@@ -773,25 +1020,20 @@ async def get_experiment_data(filename: str):
     """Get full experiment data for comparison purposes."""
     try:
         # Load the experiment file directly
-        import os
-        import json
-        # Use environment variable for experiments folder, fallback to relative path
-        experiments_folder = os.getenv("EXPERIMENTS_FOLDER", "experiments/")
-        if experiments_folder.startswith("/"):
-            experiments_folder = experiments_folder
-        else:
-            experiments_folder = os.path.join(os.getcwd(), experiments_folder)
-        filepath = os.path.join(experiments_folder, filename)
+        if not is_valid_experiment_filename(filename):
+            return invalid_experiment_filename_error(filename)
+        filepath = os.path.join(experiment_service.experiments_folder, filename)
         
-        if not os.path.exists(filepath):
+        # A just-completed experiment may still be saving in the background
+        await wait_for_experiment_save(filename)
+        try:
+            experiment_data = await asyncio.to_thread(read_experiment_file, filepath)
+        except FileNotFoundError:
             return ErrorResponseService.not_found_error(
                 resource="Experiment file",
                 identifier=filename
             )
         
-        with open(filepath, 'r') as f:
-            experiment_data = json.load(f)
-        
         logger.info(f"📂 Retrieved full experiment data for {filename}")
         return {
             "success": True,
@@ -810,27 +1052,25 @@ async def get_experiment_data(filename: str):
 async def delete_experiment(filename: str):
     """Delete a specific experiment file."""
     try:
-        import os
-        # Use environment variable for experiments folder, fallback to relative path
-        experiments_folder = os.getenv("EXPERIMENTS_FOLDER", "experiments/")
-        if experiments_folder.startswith("/"):
-            experiments_folder = experiments_folder
-        else:
-            experiments_folder = os.path.join(os.getcwd(), experiments_folder)
-        filepath = os.path.join(experiments_folder, filename)
+        if not is_valid_experiment_filename(filename):
+            return invalid_experiment_filename_error(filename)
+        filepath = os.path.join(experiment_service.experiments_folder, filename)
         
-        if os.path.exists(filepath):
+        # Otherwise a save still in flight would recreate the file after it is deleted
+        await wait_for_experiment_save(filename)
+        try:
             os.remove(filepath)
-            logger.info(f"🗑️ Deleted experiment file {filename}")
-            return {
-                "success": True,
-                "message": f"Deleted experiment {filename}"
-            }
-        else:
+        except FileNotFoundError:
             return ErrorResponseService.not_found_error(
                 resource="Experiment file",
                 identifier=filename
             )
+        
+        logger.info(f"🗑️ Deleted experiment file {filename}")
+        return {
+            "success": True,
+            "message": f"Deleted experiment {filename}"
+        }
     except Exception as e:
         return ErrorResponseService.log_and_return_error(
             error=e,
@@ -839,22 +1079,36 @@ async def delete_experiment(filename: str):
             user_message="Failed to delete experiment"
         )
 
+async def send_ws_json(websocket: WebSocket, payload: Dict[str, Any]) -> None:
+    """
+    Send a JSON payload over a WebSocket, serialized with orjson.
+    
+    Frames stay text frames so clients can keep using JSON.parse(event.data).
+    
+    Args:
+        websocket: WebSocket connection
+        payload: JSON-serializable payload
+    """
+    await websocket.send_text(orjson.dumps(payload).decode('utf-8'))
+
 @app.websocket("/ws/experiment/stream")
 async def websocket_experiment_stream(websocket: WebSocket):
     logger.info("🔌 WebSocket connection attempt")
     await websocket.accept()
     logger.info("✅ WebSocket connection accepted")
     
-    # Track experiment timing
+    # Track experiment timing: wall clock for reporting, monotonic clock for the duration
     experiment_start_time = datetime.now()
+    experiment_start_monotonic = time.monotonic()
     logger.info(f"⏱️ Experiment started at: {experiment_start_time.isoformat()}")
     
     try:
         # Wait for configuration from the client
         logger.info("⏳ Waiting for configuration from client...")
-        config_data = await websocket.receive_json()
+        config_data = await websocket.receive_text()
         logger.info(f"📨 Received config: {config_data}")
-        config = ExperimentConfig(**config_data)
+        # Parse and validate in one step in pydantic-core instead of json.loads + ExperimentConfig(**data)
+        config = ExperimentConfig.model_validate_json(config_data)
         logger.info(f"✅ Config validated: {config.selected_groups} groups, {config.top_k} top_k")
         
         # Generate questions based on selected groups using real data
@@ -866,79 +1120,124 @@ async def websocket_experiment_stream(websocket: WebSocket):
         current_experiment_results = []
         await stream_question_results(websocket, all_questions, config, current_experiment_results)
         
-        # Calculate experiment timing
-        experiment_end_time = datetime.now()
-        experiment_duration = (experiment_end_time - experiment_start_time).total_seconds()
-        logger.info(f"⏱️ Experiment completed in {experiment_duration:.2f} seconds")
+        # Calculate experiment timing once for the saved results and the completion signal
+        experiment_end_time, timing = build_experiment_timing(experiment_start_time, experiment_start_monotonic)
+        logger.info(f"⏱️ Experiment completed in {timing['duration_seconds']:.2f} seconds")
         
-        # Save experiment results with config and timing
-        saved_filename = experiment_service.save_experiment_results(
-            current_experiment_results, 
+        # Save experiment results in the background so the completion signal is not
+        # delayed by metadata collection and disk writes; the filename is fixed up front
+        saved_filename = experiment_service.build_experiment_filename(experiment_end_time)
+        save_task = asyncio.create_task(persist_experiment_results(
+            list(current_experiment_results),
             {
-                "config": config.dict(),
-                "timing": {
-                    "start_time": experiment_start_time.isoformat(),
-                    "end_time": experiment_end_time.isoformat(),
-                    "duration_seconds": experiment_duration
-                }
-            }
-        )
-        
-        # Update global variables to track this as the current experiment
-        global experiment_results, current_loaded_experiment, current_selected_documents, current_total_selected_chunks
-        experiment_results = current_experiment_results
+                "config": config.model_dump(mode="json"),
+                "timing": timing
+            },
+            experiment_end_time
+        ))
+        track_experiment_save(saved_filename, save_task)
+        
+        # Update global variables to track this as the current experiment; the previous
+        # selected documents and chunk counts stay in place until the save completes
+        global current_loaded_experiment
+        await app.state.experiment_results.replace(current_experiment_results)
         current_loaded_experiment = saved_filename
         
-        # Extract selected documents and chunks info from the saved experiment
-        try:
-            import os
-            import json
-            # Use environment variable for experiments folder, fallback to relative path
-            experiments_folder = os.getenv("EXPERIMENTS_FOLDER", "experiments/")
-            if experiments_folder.startswith("/"):
-                experiments_folder = experiments_folder
-            else:
-                experiments_folder = os.path.join(os.getcwd(), experiments_folder)
-            saved_filepath = os.path.join(experiments_folder, saved_filename)
-            
-            if os.path.exists(saved_filepath):
-                with open(saved_filepath, 'r') as f:
-                    experiment_data = json.load(f)
-                current_selected_documents = experiment_data.get("metadata", {}).get("selected_documents", [])
-                current_total_selected_chunks = experiment_data.get("metadata", {}).get("total_selected_chunks", 0)
-                logger.info(f"📊 Updated current experiment tracking: {len(current_selected_documents)} documents, {current_total_selected_chunks} chunks")
-        except Exception as e:
-            logger.warning(f"Could not extract metadata from saved experiment: {e}")
-            current_selected_documents = []
-            current_total_selected_chunks = 0
-        
         # Send completion signal with timing info and saved filename
         logger.info(f"🏁 Sending completion signal with saved filename: {saved_filename}")
-        await websocket.send_json({
+        await send_ws_json(websocket, {
             "type": "completed", 
             "message": "Experiment completed",
             "saved_filename": saved_filename,
-            "timing": {
-                "start_time": experiment_start_time.isoformat(),
-                "end_time": experiment_end_time.isoformat(),
-                "duration_seconds": experiment_duration
-            }
+            "timing": timing
         })
     except Exception as e:
-        experiment_end_time = datetime.now()
-        experiment_duration = (experiment_end_time - experiment_start_time).total_seconds()
-        logger.error(f"❌ Experiment failed after {experiment_duration:.2f} seconds: {e}")
-        await websocket.send_json({
+        _, timing = build_experiment_timing(experiment_start_time, experiment_start_monotonic)
+        logger.error(f"❌ Experiment failed after {timing['duration_seconds']:.2f} seconds: {e}")
+        await send_ws_json(websocket, {
             "type": "error", 
             "message": f"Experiment failed: {str(e)}",
-            "timing": {
-                "start_time": experiment_start_time.isoformat(),
-                "end_time": experiment_end_time.isoformat(),
-                "duration_seconds": experiment_duration
-            }
+            "timing": timing
         })
         await websocket.close()
 
+def track_experiment_save(filename: str, task: asyncio.Task) -> None:
+    """Register a background experiment save so readers of its file can wait for it."""
+    pending_experiment_saves[filename] = task
+    
+    def forget(done_task: asyncio.Task) -> None:
+        # A later save to the same filename may have replaced this one
+        if pending_experiment_saves.get(filename) is done_task:
+            del pending_experiment_saves[filename]
+    
+    task.add_done_callback(forget)
+
+async def wait_for_experiment_save(filename: Optional[str] = None) -> None:
+    """Wait until a pending background save of the given experiment file, or of every file, has finished."""
+    if filename is None:
+        save_tasks = set(pending_experiment_saves.values())
+    else:
+        save_tasks = {pending_experiment_saves[filename]} if filename in pending_experiment_saves else set()
+    if save_tasks:
+        # asyncio.wait neither raises the saves' errors nor cancels them if this request is cancelled
+        await asyncio.wait(save_tasks)
+
+async def run_on_ingestion_executor(func, *args):
+    """Run a corpus rebuild or ingestion on the ingestion executor so it cannot overlap other ingestions."""
+    return await asyncio.get_running_loop().run_in_executor(ingestion_executor, func, *args)
+
+def corpus_job_in_progress_error() -> Dict[str, Any]:
+    """Error response for a rebuild or bulk ingestion requested while another one is running."""
+    return ErrorResponseService.create_error_response(
+        error_type=ErrorType.RESOURCE_CONFLICT,
+        message="Corpus rebuild or ingestion already in progress"
+    )
+
+def build_experiment_timing(start_time: datetime, start_monotonic: float) -> Tuple[datetime, Dict[str, Any]]:
+    """
+    Build the timing information reported for an experiment that ends now.
+    
+    Args:
+        start_time: Wall-clock start time
+        start_monotonic: time.monotonic() at the start, so the duration is immune to clock adjustments
+        
+    Returns:
+        The end time and a dictionary with ISO start/end times and the duration in seconds
+    """
+    end_time = datetime.now()
+    return end_time, {
+        "start_time": start_time.isoformat(),
+        "end_time": end_time.isoformat(),
+        "duration_seconds": time.monotonic() - start_monotonic
+    }
+
+async def persist_experiment_results(results: List[Dict[str, Any]], config: Dict[str, Any], timestamp: datetime) -> None:
+    """
+    Save experiment results off the event loop and refresh current experiment tracking.
+    
+    Args:
+        results: Snapshot of the experiment results
+        config: Experiment config and timing information
+        timestamp: Timestamp that determines the saved filename
+    """
+    global current_selected_documents, current_total_selected_chunks
+    
+    saved_filename, saved_metadata = await asyncio.to_thread(
+        experiment_service.save_experiment_results, results, config, timestamp
+    )
+    if not saved_filename:
+        logger.error("❌ Background save of experiment results failed")
+        return
+    
+    # Only update tracking if this experiment is still the current one
+    if current_loaded_experiment != saved_filename:
+        return
+    
+    # Take selected documents and chunks info from the metadata that was just saved
+    current_selected_documents = saved_metadata.get("selected_documents", [])
+    current_total_selected_chunks = saved_metadata.get("total_selected_chunks", 0)
+    logger.info(f"📊 Updated current experiment tracking: {len(current_selected_documents)} documents, {current_total_selected_chunks} chunks")
+
 def generate_experiment_questions() -> List[Dict[str, Any]]:
     """
     Generate all questions for the experiment simulation.
@@ -988,6 +1287,37 @@ def generate_ragas_experiment_questions() -> List[Dict[str, Any]]:
         } for i in range(30)
     ]
 
+def flatten_question_groups(question_groups: List[Dict[str, Any]], source: str) -> List[Dict[str, Any]]:
+    """
+    Flatten role-grouped questions into experiment question dictionaries.
+    
+    Args:
+        question_groups: Groups with a role and their questions
+        source: Question source used for ids and the source field
+        
+    Returns:
+        Question dictionaries numbered from 1 in group order
+    """
+    return [
+        {
+            "question_id": f"{source}_q_{number:03d}",
+            "question": question["text"],
+            "source": source,
+            "focus": question.get("focus", "General"),
+            "role_name": role_name
+        }
+        for number, (role_name, question) in enumerate(
+            ((group["role"], question) for group in question_groups for question in group.get("questions", [])),
+            start=1
+        )
+    ]
+
+# Question sets are fixed after startup, so flatten them once instead of on every experiment
+EXPERIMENT_QUESTIONS_BY_SOURCE = {
+    "llm": tuple(flatten_question_groups(LLM_QUESTIONS["questions"], "llm")),
+    "ragas": tuple(flatten_question_groups(RAGAS_QUESTIONS["questions"], "ragas"))
+}
+
 def generate_real_experiment_questions(selected_groups: List[str]) -> List[Dict[str, Any]]:
     """
     Generate real questions from JSON files based on selected groups.
@@ -999,36 +1329,14 @@ def generate_real_experiment_questions(selected_groups: List[str]) -> List[Dict[
         List of real question dictionaries from JSON data
     """
     all_questions = []
-    question_counter = 1
     
     if "llm" in selected_groups:
         # Get real LLM questions from loaded data
-        llm_data = LLM_QUESTIONS["questions"]
-        for group in llm_data:
-            for question in group.get("questions", []):
-                all_questions.append({
-                    "question_id": f"llm_q_{question_counter:03d}",
-                    "question": question["text"],
-                    "source": "llm",
-                    "focus": question.get("focus", "General"),
-                    "role_name": group["role"]
-                })
-                question_counter += 1
+        all_questions.extend(EXPERIMENT_QUESTIONS_BY_SOURCE["llm"])
     
     if "ragas" in selected_groups:
-        # Get real RAGAS questions from loaded data
-        ragas_data = RAGAS_QUESTIONS["questions"]
-        question_counter = 1  # Reset counter for RAGAS
-        for group in ragas_data:
-            for question in group.get("questions", []):
-                all_questions.append({
-                    "question_id": f"ragas_q_{question_counter:03d}",
-                    "question": question["text"],
-                    "source": "ragas",
-                    "focus": question.get("focus", "General"),
-                    "role_name": group["role"]
-                })
-                question_counter += 1
+        # Get real RAGAS questions from loaded data (numbering restarts per source)
+        all_questions.extend(EXPERIMENT_QUESTIONS_BY_SOURCE["ragas"])
     
     return all_questions
 
@@ -1036,50 +1344,131 @@ async def stream_question_results(websocket: WebSocket, questions: List[Dict[str
     """
     Stream processing results for each question using real vector search.
     
+    Questions are searched in batches (one embedding request and one Qdrant
+    round-trip per batch); batch searches run ahead concurrently while results
+    are streamed back in question order as one "batch" frame per batch that
+    carries both the results and the progress update.
+    
     Args:
         websocket: WebSocket connection
         questions: List of questions to process
         config: Experiment configuration
         results_list: List to store experiment results
     """
-    for i, question in enumerate(questions):
-        try:
-            # Simulate processing delay
-            await asyncio.sleep(0.3)
-            
-            # Perform real vector search
-            result = await process_question_with_search(question, config)
-            
-            # Convert similarity to quality score for streaming
-            result_with_quality_score = {
-                **result,
-                "avg_quality_score": QualityScoreService.similarity_to_quality_score(result["avg_similarity"])
-            }
-            
-            # Store the result in the provided list
-            results_list.append(result)
+    total = len(questions)
+    batch_size = EXPERIMENT_CONFIG['QUESTION_BATCH_SIZE']
+    search_semaphore = asyncio.Semaphore(EXPERIMENT_CONFIG['MAX_CONCURRENT_SEARCHES'])
+    batches = [questions[start:start + batch_size] for start in range(0, total, batch_size)]
+    
+    async def process_batch(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        async with search_semaphore:
+            return await process_questions_with_search(batch, config)
+    
+    batch_tasks = [asyncio.create_task(process_batch(batch)) for batch in batches]
+    try:
+        processed = 0
+        for batch, batch_task in zip(batches, batch_tasks):
+            try:
+                batch_results = await batch_task
+            except Exception as e:
+                batch_results = [e] * len(batch)
             
-            await websocket.send_json(result_with_quality_score)
+            batch_items = []
+            for question, result in zip(batch, batch_results):
+                processed += 1
+                try:
+                    if isinstance(result, Exception):
+                        raise result
+                    
+                    # Convert similarity to quality score for streaming
+                    result_with_quality_score = {
+                        **result,
+                        "avg_quality_score": QualityScoreService.similarity_to_quality_score(result["avg_similarity"])
+                    }
+                    if not config.include_content:
+                        result_with_quality_score["retrieved_docs"] = preview_retrieved_docs(result["retrieved_docs"])
+                    
+                    # Store the result in the provided list
+                    results_list.append(result)
+                    
+                    batch_items.append(result_with_quality_score)
+                    
+                except Exception as e:
+                    logger.error(f"❌ Error processing question {question.get('question_id', 'unknown')}: {e}")
+                    # Send error result but continue
+                    error_result = {
+                        **question,
+                        "avg_similarity": 0.0,
+                        "retrieved_docs": [],
+                        "error": str(e)
+                    }
+                    batch_items.append(error_result)
             
-            # Send progress update
-            progress = ((i + 1) / len(questions)) * 100
-            await websocket.send_json({
-                "type": "progress",
+            # Send the batch's results together with its progress update in one frame
+            progress = (processed / total) * 100
+            await send_ws_json(websocket, {
+                "type": "batch",
+                "results": batch_items,
                 "progress": round(progress, 1),
-                "processed": i + 1,
-                "total": len(questions)
+                "processed": processed,
+                "total": total
             })
-            
-        except Exception as e:
-            logger.error(f"❌ Error processing question {question.get('question_id', 'unknown')}: {e}")
-            # Send error result but continue
-            error_result = {
+    finally:
+        # Stop outstanding searches if streaming was interrupted (e.g. client disconnect)
+        for batch_task in batch_tasks:
+            batch_task.cancel()
+
+def preview_retrieved_docs(retrieved_docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Shorten retrieved doc content to a preview for streaming.
+    
+    Args:
+        retrieved_docs: Retrieved documents with full chunk content
+        
+    Returns:
+        Copies of the documents with content cut to the preview length
+    """
+    preview_chars = EXPERIMENT_CONFIG['STREAMED_CONTENT_PREVIEW_CHARS']
+    return [
+        {**doc, "content": doc["content"][:preview_chars]} if len(doc["content"]) > preview_chars else doc
+        for doc in retrieved_docs
+    ]
+
+async def process_questions_with_search(questions: List[Dict[str, Any]], config: ExperimentConfig) -> List[Dict[str, Any]]:
+    """
+    Process a batch of questions using a single batched vector search.
+    
+    Args:
+        questions: Question dictionaries
+        config: Experiment configuration
+        
+    Returns:
+        Result dictionaries in the same order as the questions
+    """
+    try:
+        # The processor is synchronous, so run it in a worker thread
+        batch_search_results = await asyncio.to_thread(
+            unified_doc_processor.search_documents_batch,
+            queries=[question["question"] for question in questions],
+            limit=config.top_k,
+            filter_selected=True
+        )
+    except Exception as e:
+        logger.error(f"❌ Batch search failed for {len(questions)} questions: {e}")
+        return [
+            {
                 **question,
                 "avg_similarity": 0.0,
                 "retrieved_docs": [],
                 "error": str(e)
             }
-            await websocket.send_json(error_result)
+            for question in questions
+        ]
+    
+    return [
+        build_question_result(question, search_results)
+        for question, search_results in zip(questions, batch_search_results)
+    ]
 
 async def process_question_with_search(question: Dict[str, Any], config: ExperimentConfig) -> Dict[str, Any]:
     """
@@ -1095,35 +1484,16 @@ async def process_question_with_search(question: Dict[str, Any], config: Experim
     try:
         query = question["question"]
         
-        # Perform vector search with configuration
-        search_results = unified_doc_processor.search_documents(
+        # Perform vector search with configuration; the processor is synchronous,
+        # so run it in a worker thread
+        search_results = await asyncio.to_thread(
+            unified_doc_processor.search_documents,
             query=query,
             limit=config.top_k,
             filter_selected=True
         )
         
-        # Calculate average similarity
-        if search_results:
-            avg_similarity = sum(r["similarity"] for r in search_results) / len(search_results)
-        else:
-            avg_similarity = 0.0
-        
-        # Format retrieved documents
-        retrieved_docs = []
-        for result in search_results:
-            retrieved_docs.append({
-                "doc_id": result["doc_id"],
-                "chunk_id": result.get("chunk_id", "unknown"),
-                "content": result.get("content", ""),
-                "similarity": result["similarity"],
-                "title": result["title"]
-            })
-        
-        return {
-            **question,
-            "avg_similarity": round(avg_similarity, 3),
-            "retrieved_docs": retrieved_docs
-        }
+        return build_question_result(question, search_results)
         
     except Exception as e:
         logger.error(f"❌ Search failed for question {question.get('question_id', 'unknown')}: {e}")
@@ -1134,14 +1504,49 @@ async def process_question_with_search(question: Dict[str, Any], config: Experim
             "error": str(e)
         }
 
+def build_question_result(question: Dict[str, Any], search_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build a question result from its vector search results.
+    
+    Args:
+        question: Question dictionary
+        search_results: Search results for the question
+        
+    Returns:
+        Result dictionary with average similarity and retrieved docs
+    """
+    # Calculate average similarity
+    if search_results:
+        avg_similarity = sum(r["similarity"] for r in search_results) / len(search_results)
+    else:
+        avg_similarity = 0.0
+    
+    # Copy the question once and fill in the result fields
+    question_result = question.copy()
+    question_result["avg_similarity"] = round(avg_similarity, 3)
+    question_result["retrieved_docs"] = [
+        {
+            "doc_id": result["doc_id"],
+            "chunk_id": result.get("chunk_id", "unknown"),
+            "content": result.get("content", ""),
+            "similarity": result["similarity"],
+            "title": result["title"]
+        }
+        for result in search_results
+    ]
+    return question_result
+
 @app.get("/")
 async def root():
+    document_count = 0
+    if documents_loaded:
+        document_count = (await asyncio.to_thread(unified_doc_processor.get_corpus_stats))["document_count"]
     return {
         "message": "RagCheck API", 
         "status": "running",
         "document_processor": {
             "initialized": documents_loaded,
-                            "documents_loaded": unified_doc_processor.get_corpus_stats()["document_count"] if documents_loaded else 0,
+            "documents_loaded": document_count,
             "mode": "real_data" if documents_loaded else "mock_data"
         }
     }
@@ -1160,7 +1565,9 @@ async def search_corpus(query: str, top_k: int = 5):
         logger.info(f"🔍 Searching corpus for: {query[:100]}...")
         
         # Perform vector search using unified processor
-        results = unified_doc_processor.search_documents(query, top_k, filter_selected=True)
+        results = await asyncio.to_thread(
+            unified_doc_processor.search_documents, query, top_k, filter_selected=True, use_semantic_cache=True
+        )
         
         logger.info(f"📚 Found {len(results)} relevant documents")
         
@@ -1187,8 +1594,11 @@ async def reload_corpus():
     try:
         logger.info("🔄 Reloading corpus data...")
         
-        # Get stats from unified processor
-        stats = unified_doc_processor.get_corpus_stats()
+        # Drop cached status so an explicit reload reports fresh stats
+        unified_doc_processor.invalidate_caches()
+        
+        # Get stats from unified processor without blocking the event loop
+        stats = await asyncio.to_thread(unified_doc_processor.get_corpus_stats)
         
         if stats["corpus_loaded"]:
             documents_loaded = True
@@ -1224,41 +1634,49 @@ async def rebuild_corpus():
     """Rebuild the corpus with enhanced metadata (for testing enhanced chunking)."""
     global documents_loaded
     
+    if corpus_rebuild_lock.locked():
+        return {
+            "success": False,
+            "message": "Corpus rebuild or ingestion already in progress",
+            "documents_loaded": 0
+        }
+    
     try:
-        logger.info("🔄 Rebuilding corpus with enhanced metadata...")
-        
-        # Use unified processor to scan and update documents
-        scan_result = unified_doc_processor.scan_and_update_documents()
-        if scan_result.get("new_documents_added", 0) == 0:
-            return {
-                "success": False,
-                "message": "No documents found to rebuild corpus",
-                "documents_loaded": 0
-            }
-        
-        # Force rebuild using unified processor
-        success = unified_doc_processor.force_rebuild_collection()
-        if not success:
+        async with corpus_rebuild_lock:
+            logger.info("🔄 Rebuilding corpus with enhanced metadata...")
+            
+            # Scan and rebuild in worker threads so the event loop keeps serving requests
+            scan_result = await asyncio.to_thread(unified_doc_processor.scan_and_update_documents)
+            if scan_result.get("new_documents_added", 0) == 0:
+                return {
+                    "success": False,
+                    "message": "No documents found to rebuild corpus",
+                    "documents_loaded": 0
+                }
+            
+            # Force rebuild using unified processor
+            success = await run_on_ingestion_executor(unified_doc_processor.force_rebuild_collection)
+            if not success:
+                return {
+                    "success": False,
+                    "message": "Failed to rebuild corpus",
+                    "documents_loaded": 0
+                }
+            
+            # Update document loaded status
+            documents_loaded = True
+            
+            # Get final stats
+            stats = await asyncio.to_thread(unified_doc_processor.get_corpus_stats)
+            
+            logger.info("✅ Corpus rebuilt successfully with enhanced metadata")
             return {
-                "success": False,
-                "message": "Failed to rebuild corpus",
-                "documents_loaded": 0
+                "success": True,
+                "message": "Corpus rebuilt successfully with enhanced metadata",
+                "documents_loaded": stats["document_count"],
+                "processor_ready": True,
+                "enhanced_metadata": True
             }
-        
-        # Update document loaded status
-        documents_loaded = True
-        
-        # Get final stats
-        stats = unified_doc_processor.get_corpus_stats()
-        
-        logger.info("✅ Corpus rebuilt successfully with enhanced metadata")
-        return {
-            "success": True,
-            "message": "Corpus rebuilt successfully with enhanced metadata",
-            "documents_loaded": stats["document_count"],
-            "processor_ready": True,
-            "enhanced_metadata": True
-        }
             
     except Exception as e:
         logger.error(f"❌ Corpus rebuild failed: {str(e)}")
@@ -1275,7 +1693,7 @@ async def get_document_status():
     """Get comprehensive document status and selection information."""
     try:
         # Use unified processor for document status
-        status = unified_doc_processor.get_document_status()
+        status = await asyncio.to_thread(unified_doc_processor.get_document_status)
         logger.info("📊 Retrieved document status from unified processor")
         return {"success": True, "data": status}
     except Exception as e:
@@ -1288,7 +1706,7 @@ async def get_document_status():
 async def select_document(filename: str):
     """Select a document for ingestion."""
     try:
-        success = unified_doc_processor.select_document(filename)
+        success = await asyncio.to_thread(unified_doc_processor.select_document, filename)
         if success:
             logger.info(f"✅ Document selected: {filename}")
             return {"success": True, "message": f"Document '{filename}' selected successfully"}
@@ -1308,7 +1726,7 @@ async def select_document(filename: str):
 async def deselect_document(filename: str):
     """Deselect a document (retain vectors but exclude from search)."""
     try:
-        success = unified_doc_processor.deselect_document(filename)
+        success = await asyncio.to_thread(unified_doc_processor.deselect_document, filename)
         if success:
             logger.info(f"✅ Document deselected: {filename}")
             return {"success": True, "message": f"Document '{filename}' deselected successfully (vectors retained)"}
@@ -1327,26 +1745,48 @@ async def deselect_document(filename: str):
 async def progress_websocket(websocket: WebSocket):
     """WebSocket endpoint for real-time progress updates."""
     await websocket.accept()
+    
+    # Finishes when the client disconnects, so idle connections don't wait for progress forever
+    disconnected = asyncio.create_task(wait_for_websocket_disconnect(websocket))
     try:
         while True:
+            # Take the current event before reading progress so no update in between is missed
+            changed = ingestion_progress_changed
+            
             # Only send progress if there's active progress data and it's not empty
-            if ingestion_progress and len(ingestion_progress) > 0:
-                active_progress = {
-                    filename: progress for filename, progress in ingestion_progress.items()
-                    if progress.get('stage') not in ['complete', 'error']
-                }
-                
-                if active_progress:
-                    await websocket.send_json({
-                        "type": "progress_update",
-                        "data": active_progress
-                    })
+            active_progress = {
+                filename: progress for filename, progress in list(ingestion_progress.items())
+                if progress.get('stage') not in ['complete', 'error']
+            }
+            if active_progress:
+                await send_ws_json(websocket, {
+                    "type": "progress_update",
+                    "data": active_progress
+                })
             
-            await asyncio.sleep(2)  # Update every 2 seconds instead of 1 to reduce frequency
+            # Sleep until progress changes instead of polling
+            changed_wait = asyncio.create_task(changed.wait())
+            await asyncio.wait({changed_wait, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnected.done():
+                changed_wait.cancel()
+                break
     except Exception as e:
         logger.error(f"❌ WebSocket error: {e}")
     finally:
-        await websocket.close()
+        disconnected.cancel()
+        if websocket.client_state != WebSocketState.DISCONNECTED:
+            await websocket.close()
+
+async def wait_for_websocket_disconnect(websocket: WebSocket) -> None:
+    """Consume incoming messages until the client disconnects."""
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+def notify_ingestion_progress_changed() -> None:
+    """Wake all progress WebSockets by setting the current event and starting a fresh one (event loop only)."""
+    global ingestion_progress_changed
+    changed, ingestion_progress_changed = ingestion_progress_changed, asyncio.Event()
+    changed.set()
 
 def update_ingestion_progress(progress_data: dict):
     """Update ingestion progress for WebSocket clients."""
@@ -1357,6 +1797,11 @@ def update_ingestion_progress(progress_data: dict):
     ingestion_progress[filename] = progress_data
     logger.info(f"📊 Progress update: {progress_data.get('message', 'Unknown')}")
     
+    # Updates mostly come from ingestion threads, so hand follow-up work to the event loop
+    if main_event_loop is None or main_event_loop.is_closed():
+        return
+    main_event_loop.call_soon_threadsafe(notify_ingestion_progress_changed)
+    
     # Clean up completed progress after a delay
     if progress_data.get('stage') in ['complete', 'error']:
         def cleanup_progress():
@@ -1365,11 +1810,8 @@ def update_ingestion_progress(progress_data: dict):
                 del ingestion_progress[filename]
                 logger.info(f"🧹 Cleaned up progress for {filename}")
         
-        # Schedule cleanup after 30 seconds (longer delay for polling)
-        import threading
-        timer = threading.Timer(30.0, cleanup_progress)
-        timer.daemon = True
-        timer.start()
+        # Schedule cleanup after 30 seconds (longer delay for polling) as a loop timer rather than a new thread
+        main_event_loop.call_soon_threadsafe(main_event_loop.call_later, 30.0, cleanup_progress)
 
 @app.post("/api/documents/ingest/{filename}")
 async def ingest_document(filename: str):
@@ -1392,8 +1834,7 @@ async def ingest_document(filename: str):
                 "timestamp": datetime.now().isoformat()
             })
         
-        # Run ingestion in a thread to avoid blocking
-        import threading
+        # Run ingestion in the ingestion thread pool to avoid blocking
         def run_ingestion():
             try:
                 success = unified_doc_processor.ingest_document(filename, progress_callback)
@@ -1422,10 +1863,9 @@ async def ingest_document(filename: str):
                     "timestamp": datetime.now().isoformat()
                 })
         
-        # Start the ingestion thread
-        thread = threading.Thread(target=run_ingestion)
-        thread.daemon = True
-        thread.start()
+        # Queue the ingestion without waiting for it; the single worker runs it after any
+        # ingestion or rebuild already on the executor
+        asyncio.get_running_loop().run_in_executor(ingestion_executor, run_ingestion)
         
         # Return immediate response
         logger.info(f"🔄 Started ingestion process for: {filename}")
@@ -1459,9 +1899,13 @@ async def get_ingestion_progress():
 @app.post("/api/documents/ingest-pending")
 async def ingest_pending_documents():
     """Ingest all documents that are selected but not yet ingested."""
+    if corpus_rebuild_lock.locked():
+        return corpus_job_in_progress_error()
+    
     try:
         # Trigger ingestion of pending documents
-        unified_doc_processor.ingest_pending_documents()
+        async with corpus_rebuild_lock:
+            await run_on_ingestion_executor(unified_doc_processor.ingest_pending_documents)
         logger.info("✅ Pending documents ingestion completed")
         return {"success": True, "message": "Pending documents ingestion completed"}
     except Exception as e:
@@ -1473,8 +1917,12 @@ async def ingest_pending_documents():
 @app.post("/api/documents/reingest-changed")
 async def reingest_changed_documents():
     """Re-ingest documents that have changed since last ingestion."""
+    if corpus_rebuild_lock.locked():
+        return corpus_job_in_progress_error()
+    
     try:
-        success = unified_doc_processor.reingest_changed_documents()
+        async with corpus_rebuild_lock:
+            success = await run_on_ingestion_executor(unified_doc_processor.reingest_changed_documents)
         if success:
             logger.info("✅ Changed documents re-ingestion completed")
             return {"success": True, "message": "Changed documents re-ingestion completed"}
@@ -1493,7 +1941,7 @@ async def reingest_changed_documents():
 async def load_documents():
     """Scan data folder and add new documents to the tracked list."""
     try:
-        result = unified_doc_processor.scan_and_update_documents()
+        result = await asyncio.to_thread(unified_doc_processor.scan_and_update_documents)
         logger.info("✅ Document load completed")
         return {"success": True, "data": result, "message": f"Document load completed: {result.get('new_documents_added', 0)} new documents added"}
     except Exception as e:
@@ -1505,8 +1953,12 @@ async def load_documents():
 @app.post("/api/documents/rebuild")
 async def rebuild_collection():
     """Force rebuild the entire collection (use with caution)."""
+    if corpus_rebuild_lock.locked():
+        return corpus_job_in_progress_error()
+    
     try:
-        success = unified_doc_processor.force_rebuild_collection()
+        async with corpus_rebuild_lock:
+            success = await run_on_ingestion_executor(unified_doc_processor.force_rebuild_collection)
         if success:
             logger.info("✅ Collection rebuild completed")
             return {"success": True, "message": "Collection rebuild completed successfully"}
@@ -1525,7 +1977,7 @@ async def rebuild_collection():
 async def refresh_chunk_selection():
     """Force refresh the selection status of all chunks."""
     try:
-        success = unified_doc_processor.refresh_chunk_selection_status()
+        success = await asyncio.to_thread(unified_doc_processor.refresh_chunk_selection_status)
         if success:
             logger.info("✅ Chunk selection status refreshed successfully")
             return {"success": True, "message": "Chunk selection status refreshed successfully"}
@@ -1544,7 +1996,7 @@ async def refresh_chunk_selection():
 async def validate_chunk_metadata():
     """Validate that all chunks have the required metadata fields."""
     try:
-        validation_results = unified_doc_processor.validate_chunk_metadata()
+        validation_results = await asyncio.to_thread(unified_doc_processor.validate_chunk_metadata)
         if validation_results:
             logger.info("✅ Chunk metadata validation completed")
             return {"success": True, "data": validation_results}
@@ -1563,7 +2015,9 @@ async def validate_chunk_metadata():
 async def search_documents(query: str, limit: int = 10, filter_selected: bool = True):
     """Search documents with optional selection filter."""
     try:
-        results = unified_doc_processor.search_documents(query, limit, filter_selected)
+        results = await asyncio.to_thread(
+            unified_doc_processor.search_documents, query, limit, filter_selected, use_semantic_cache=True
+        )
         logger.info(f"🔍 Document search completed: {len(results)} results")
         return {"success": True, "data": results, "count": len(results)}
     except Exception as e:
@@ -1593,21 +2047,20 @@ async def upload_document(file: UploadFile = File(...)):
         # Save file to data folder
         file_path = os.path.join(data_folder, file.filename)
         
-        # Check if file already exists
-        if os.path.exists(file_path):
+        # Save the uploaded file; exclusive create fails if the file already exists
+        content = await file.read()
+        try:
+            with open(file_path, "xb") as buffer:
+                buffer.write(content)
+        except FileExistsError:
             return ErrorResponseService.log_and_return_error(
                 error=None, context=f"File already exists: {file.filename}",
                 error_type=ErrorType.VALIDATION_ERROR, 
                 user_message=f"File '{file.filename}' already exists in the data folder"
             )
         
-        # Save the uploaded file
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-        
         # Add the document to tracking (but don't auto-select it)
-        success = unified_doc_processor.selection_manager.add_document_to_tracking(file.filename)
+        success = await asyncio.to_thread(unified_doc_processor.add_document_to_tracking, file.filename)
         
         if success:
             logger.info(f"✅ Document uploaded and added to tracking: {file.filename}")
@@ -1655,12 +2108,14 @@ async def delete_document(filename: str):
         
         # Delete file from data folder
         file_path = os.path.join(data_folder, filename)
-        if os.path.exists(file_path):
+        try:
             os.remove(file_path)
             logger.info(f"✅ File deleted from data folder: {filename}")
+        except FileNotFoundError:
+            pass
         
         # Remove document from tracking
-        success = unified_doc_processor.selection_manager.remove_document_from_tracking(filename)
+        success = await asyncio.to_thread(unified_doc_processor.remove_document_from_tracking, filename)
         
         if success:
             logger.info(f"✅ Document removed from tracking: {filename}")
@@ -1689,7 +2144,7 @@ async def clear_document_cache():
     """Clear document cache and force reload from configuration."""
     try:
         # Force reload of document selection configuration
-        unified_doc_processor.selection_manager.selection_config = unified_doc_processor.selection_manager._load_selection_config()
+        await asyncio.to_thread(unified_doc_processor.reload_selection_config)
         
         logger.info("🗑️ Document cache cleared and configuration reloaded")
         return {
@@ -1727,15 +2182,23 @@ async def get_environment_info():
             error_type=ErrorType.INTERNAL_ERROR, user_message="Failed to retrieve environment information"
         )
 
-@app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup resources when the application shuts down."""
     try:
         logger.info("🔄 Shutting down application...")
         
+        # Let in-flight experiment saves finish writing to disk
+        if pending_experiment_saves:
+            logger.info(f"💾 Waiting for {len(pending_experiment_saves)} pending experiment saves...")
+            await asyncio.gather(*pending_experiment_saves.values(), return_exceptions=True)
+        
+        # Drop queued ingestions; one already running is allowed to finish
+        ingestion_executor.shutdown(wait=False, cancel_futures=True)
+        
         # Close Qdrant connections
         if hasattr(unified_doc_processor, 'qdrant_manager') and unified_doc_processor.qdrant_manager:
             unified_doc_processor.qdrant_manager.close_connection()
+            await unified_doc_processor.qdrant_manager.close_async_connection()
             logger.info("🔌 Closed Qdrant connection")
         
         logger.info("✅ Application shutdown complete")
@@ -1745,7 +2208,9 @@ async def shutdown_event():
 @app.get("/api/debug/globals")
 async def debug_globals():
     """Debug endpoint to check global variables."""
-    global experiment_results, current_loaded_experiment, current_selected_documents, current_total_selected_chunks
+    global current_loaded_experiment, current_selected_documents, current_total_selected_chunks
+    
+    experiment_results = await app.state.experiment_results.snapshot()
     
     return {
         "experiment_results_count": len(experiment_results) if experiment_results else 0,
@@ -1756,4 +2221,13 @@ async def debug_globals():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvloop and httptools ship with uvicorn[standard]. Keep a single worker:
+    # experiment results, ingestion progress and caches live in process memory.
+    uvicorn.run(
+        app,
+        host=SERVER_CONFIG['HOST'],
+        port=SERVER_CONFIG['PORT'],
+        loop="uvloop",
+        http="httptools",
+        workers=1
+    )
\ No newline at end of file
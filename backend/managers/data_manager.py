@@ -303,9 +303,9 @@ class DataManager:
             for filename in filenames:
                 if filename in documents and documents[filename].get('is_selected', False):
                     selected_files.append(filename)
-                    logger.debug(f"✅ {filename} is selected")
+                    logger.debug("✅ %s is selected", filename)
                 else:
-                    logger.debug(f"⏸️ {filename} is not selected, skipping")
+                    logger.debug("⏸️ %s is not selected, skipping", filename)
             
             return selected_files
                 
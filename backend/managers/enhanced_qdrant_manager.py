@@ -5,11 +5,12 @@ import uuid
 import time
 import threading
 from typing import List, Dict, Any, Optional
-from qdrant_client import QdrantClient, models
+from qdrant_client import QdrantClient, AsyncQdrantClient, models
 from qdrant_client.http.models import Distance, VectorParams, Filter, FieldCondition, MatchValue
 from qdrant_client.http.models import UpdateStatus, PointStruct
 from qdrant_client.http.exceptions import UnexpectedResponse
 from dotenv import load_dotenv
+from config.settings import VECTOR_DB_CONFIG
 
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
 
@@ -19,14 +20,21 @@ logger = logging.getLogger(__name__)
 # Qdrant configuration
 QDRANT_URL = os.getenv("QDRANT_URL", "http://localhost:6333")
 QDRANT_API_KEY = os.getenv("QDRANT_API_KEY")
+# Off by default: with gRPC the client ignores the QDRANT_URL port and connects to QDRANT_GRPC_PORT
+QDRANT_PREFER_GRPC = os.getenv("QDRANT_PREFER_GRPC", "false").lower() == "true"
+QDRANT_GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
 VECTOR_SIZE = 1536  # OpenAI text-embedding-3-small dimensions
 
+# Payload fields read by _scored_point_to_result; searches fetch only these
+SEARCH_RESULT_PAYLOAD_FIELDS = ["content", "metadata", "document_source", "chunk_id"]
+
 class EnhancedQdrantManager:
     """Enhanced Qdrant manager with document selection and retention capabilities."""
 
     def __init__(self, collection_name: str):
         self.collection_name = collection_name
         self._client = None
+        self._async_client = None
         self._client_lock = threading.Lock()
         self._last_connection_time = 0
         self._connection_timeout = 30  # seconds
@@ -58,6 +66,8 @@ class EnhancedQdrantManager:
                     self._client = QdrantClient(
                         url=QDRANT_URL, 
                         api_key=QDRANT_API_KEY, 
+                        prefer_grpc=QDRANT_PREFER_GRPC,  # gRPC has less serialization overhead than REST
+                        grpc_port=QDRANT_GRPC_PORT,
                         timeout=60  # Extended timeout to prevent hanging connections
                     )
                     
@@ -86,6 +96,18 @@ class EnhancedQdrantManager:
                 collection_info = client.get_collection(self.collection_name)
                 logger.info(f"📦 Collection '{self.collection_name}' exists with {collection_info.points_count} points")
                 
+                # Quantization is only added to existing collections when explicitly enabled,
+                # since it changes the user's collection and cannot be undone from here
+                if collection_info.config.quantization_config is None:
+                    if VECTOR_DB_CONFIG['QUANTIZE_EXISTING_COLLECTIONS']:
+                        logger.info("🗜️ Enabling int8 scalar quantization for existing collection...")
+                        client.update_collection(
+                            collection_name=self.collection_name,
+                            quantization_config=self._quantization_config()
+                        )
+                    else:
+                        logger.info("ℹ️ Existing collection has no quantization; enable VECTOR_DB_CONFIG['QUANTIZE_EXISTING_COLLECTIONS'] to add it")
+                
                 # Ensure payload indexes exist for existing collections
                 logger.info("🔍 Ensuring payload indexes exist for existing collection...")
                 self._ensure_payload_indexes()
@@ -100,6 +122,8 @@ class EnhancedQdrantManager:
                 vectors_config=VectorParams(size=VECTOR_SIZE, distance=Distance.COSINE),
                 # Add payload schema for document management
                 on_disk_payload=True,  # Store payloads on disk for better performance
+                # Keep an int8 copy of the vectors in RAM for 4x cheaper ANN scans
+                quantization_config=self._quantization_config()
             )
             
             # Create payload indexes for efficient filtering
@@ -193,6 +217,17 @@ class EnhancedQdrantManager:
                     self._client = None
                     self._last_connection_time = 0
 
+    async def close_async_connection(self):
+        """Close the async Qdrant client and its connection pool."""
+        if self._async_client is not None:
+            try:
+                await self._async_client.close()
+                logger.info("🔌 Closed async Qdrant connection")
+            except Exception as e:
+                logger.warning(f"⚠️ Error closing async Qdrant connection: {e}")
+            finally:
+                self._async_client = None
+
     def __del__(self):
         """Cleanup when the manager is destroyed."""
         self.close_connection()
@@ -202,6 +237,20 @@ class EnhancedQdrantManager:
         """Get the Qdrant client instance with connection management."""
         return self._get_qdrant_client()
 
+    @property
+    def async_client(self) -> AsyncQdrantClient:
+        """Get the shared async Qdrant client for calls made from the event loop."""
+        if self._async_client is None:
+            logger.info(f"🔗 Creating async Qdrant client for {QDRANT_URL}")
+            self._async_client = AsyncQdrantClient(
+                url=QDRANT_URL,
+                api_key=QDRANT_API_KEY,
+                prefer_grpc=QDRANT_PREFER_GRPC,
+                grpc_port=QDRANT_GRPC_PORT,
+                timeout=60
+            )
+        return self._async_client
+
     def add_documents_with_selection_status(self, documents: List[Dict[str, Any]], 
                                           document_source: str, 
                                           is_selected: bool = True) -> bool:
@@ -415,36 +464,17 @@ class EnhancedQdrantManager:
                                    score_threshold: float = 0.0) -> List[Dict[str, Any]]:
         """Search documents with optional selection filter."""
         try:
-            filter_condition = None
-            if filter_selected:
-                filter_condition = Filter(
-                    must=[
-                        FieldCondition(
-                            key="is_selected",
-                            match=MatchValue(value=True)
-                        )
-                    ]
-                )
-            
             search_response = self._get_qdrant_client().search(
                 collection_name=self.collection_name,
                 query_vector=query_vector,
-                query_filter=filter_condition,
+                query_filter=self._selection_filter(filter_selected),
                 limit=limit,
                 score_threshold=score_threshold,
-                with_payload=True
+                search_params=self._search_params(),
+                with_payload=SEARCH_RESULT_PAYLOAD_FIELDS
             )
             
-            results = []
-            for scored_point in search_response:
-                results.append({
-                    "id": scored_point.id,
-                    "score": scored_point.score,
-                    "content": scored_point.payload.get("content", ""),
-                    "metadata": scored_point.payload.get("metadata", {}),
-                    "document_source": scored_point.payload.get("document_source", ""),
-                    "chunk_id": scored_point.payload.get("chunk_id", "")
-                })
+            results = [self._scored_point_to_result(scored_point) for scored_point in search_response]
             
             logger.info(f"🔍 Search returned {len(results)} results (filtered by selection: {filter_selected})")
             return results
@@ -452,6 +482,91 @@ class EnhancedQdrantManager:
             logger.error(f"❌ Search failed: {e}")
             return []
 
+    def search_batch_with_selection_filter(self, query_vectors: List[List[float]], 
+                                           limit: int = 10, 
+                                           filter_selected: bool = True,
+                                           score_threshold: float = 0.0) -> List[List[Dict[str, Any]]]:
+        """Search several query vectors in one round-trip with optional selection filter."""
+        if not query_vectors:
+            return []
+        try:
+            filter_condition = self._selection_filter(filter_selected)
+            search_params = self._search_params()
+            requests = [
+                models.SearchRequest(
+                    vector=query_vector,
+                    filter=filter_condition,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    params=search_params,
+                    with_payload=SEARCH_RESULT_PAYLOAD_FIELDS
+                )
+                for query_vector in query_vectors
+            ]
+            
+            batch_response = self._get_qdrant_client().search_batch(
+                collection_name=self.collection_name,
+                requests=requests
+            )
+            
+            results = [
+                [self._scored_point_to_result(scored_point) for scored_point in search_response]
+                for search_response in batch_response
+            ]
+            
+            logger.info(f"🔍 Batch search returned results for {len(results)} queries (filtered by selection: {filter_selected})")
+            return results
+        except Exception as e:
+            logger.error(f"❌ Batch search failed: {e}")
+            return [[] for _ in query_vectors]
+
+    @staticmethod
+    def _quantization_config() -> models.ScalarQuantization:
+        """Build the int8 scalar quantization config used for the collection vectors."""
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=VECTOR_DB_CONFIG['SCALAR_QUANTIZATION_QUANTILE'],
+                always_ram=True
+            )
+        )
+
+    @staticmethod
+    def _search_params() -> models.SearchParams:
+        """Search quantized vectors, then rescore oversampled candidates with the original vectors."""
+        return models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                rescore=True,
+                oversampling=VECTOR_DB_CONFIG['QUANTIZATION_OVERSAMPLING']
+            )
+        )
+
+    @staticmethod
+    def _selection_filter(filter_selected: bool) -> Optional[Filter]:
+        """Build the is_selected payload filter used by searches."""
+        if not filter_selected:
+            return None
+        return Filter(
+            must=[
+                FieldCondition(
+                    key="is_selected",
+                    match=MatchValue(value=True)
+                )
+            ]
+        )
+
+    @staticmethod
+    def _scored_point_to_result(scored_point) -> Dict[str, Any]:
+        """Convert a Qdrant scored point into a search result dictionary."""
+        return {
+            "id": scored_point.id,
+            "score": scored_point.score,
+            "content": scored_point.payload.get("content", ""),
+            "metadata": scored_point.payload.get("metadata", {}),
+            "document_source": scored_point.payload.get("document_source", ""),
+            "chunk_id": scored_point.payload.get("chunk_id", "")
+        }
+
     def delete_document_chunks(self, document_source: str) -> bool:
         """Delete all chunks from a specific document source."""
         try:
@@ -478,6 +593,18 @@ class EnhancedQdrantManager:
             logger.error(f"❌ Failed to delete document chunks: {e}")
             return False
 
+    def recreate_collection(self) -> bool:
+        """Drop the collection and create it again empty, with quantization and payload indexes."""
+        try:
+            client = self._get_qdrant_client()
+            if client.collection_exists(self.collection_name):
+                client.delete_collection(self.collection_name)
+                logger.info(f"🗑️ Deleted collection: {self.collection_name}")
+            return self._ensure_collection_exists()
+        except Exception as e:
+            logger.error(f"❌ Failed to recreate collection: {e}")
+            return False
+
     def delete_collection_chunks(self) -> bool:
         """Delete all chunks from the collection."""
         try:
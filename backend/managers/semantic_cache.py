@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from itertools import count
+from typing import List, Dict, Any, Optional, Tuple, Set
+import numpy as np
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+class SemanticCache:
+    """
+    Embedding-level search result cache using banded random-projection LSH.
+
+    Query vectors are hashed into bits by the signs of their projections onto
+    fixed random hyperplanes. The bits are split into short bands, each with its
+    own hash table; a lookup collects every cached query sharing at least one
+    band with the new query and accepts the most similar candidate when its
+    cosine similarity is at or above the similarity threshold.
+
+    With 16 bands of 10 bits, a neighbour at cosine 0.95 (about 10% of bits
+    differ) shares some band with probability above 99.8%, while an unrelated
+    query collides in a given band only about once in a thousand lookups.
+    """
+
+    def __init__(self, dimension: int, num_bands: int = 16, bits_per_band: int = 10,
+                 similarity_threshold: float = 0.95, max_entries: int = 1000, seed: int = 42):
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.num_bands = num_bands
+
+        # Fixed seed keeps signatures stable across restarts and workers
+        rng = np.random.default_rng(seed)
+        self._projections = rng.standard_normal((dimension, num_bands * bits_per_band)).astype(np.float32)
+        # Weights that turn each band's sign bits into one integer hash key
+        self._band_weights = (1 << np.arange(bits_per_band, dtype=np.int64))
+
+        # Entry id -> (unit query vector, results, band keys, search key), least recently used first
+        self._entries: "OrderedDict[int, Tuple[np.ndarray, List[Dict[str, Any]], Tuple[int, ...], Tuple[Any, ...]]]" = OrderedDict()
+        # One table per band: (band key, search key) -> ids of entries in that bucket
+        self._tables: List[Dict[Tuple[int, Tuple[Any, ...]], Set[int]]] = [{} for _ in range(num_bands)]
+        self._ids = count()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        # Bumped on every clear so writers can detect results computed before an invalidation
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every clear(); pass it to put() to drop results that raced a clear."""
+        return self._generation
+
+    @staticmethod
+    def _normalize_many(query_vectors: List[List[float]]) -> np.ndarray:
+        """Convert query vectors to unit-length float32 rows."""
+        vectors = np.atleast_2d(np.asarray(query_vectors, dtype=np.float32))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms > 0, norms, 1.0)
+
+    def _band_keys(self, unit_vectors: np.ndarray) -> np.ndarray:
+        """Hash unit vectors into one integer key per band, shape (n, num_bands)."""
+        bits = (unit_vectors @ self._projections > 0).reshape(len(unit_vectors), self.num_bands, -1)
+        return bits @ self._band_weights
+
+    def _lookup(self, unit_vector: np.ndarray, band_keys: np.ndarray, key: Tuple[Any, ...]) -> Optional[List[Dict[str, Any]]]:
+        """Find the best cached candidate sharing a band with the query (lock must be held)."""
+        candidate_ids: Set[int] = set()
+        for table, band_key in zip(self._tables, band_keys.tolist()):
+            bucket = table.get((band_key, key))
+            if bucket:
+                candidate_ids.update(bucket)
+
+        hit = None
+        if candidate_ids:
+            candidate_ids = list(candidate_ids)
+            # Cosine similarity against every candidate in one product
+            similarities = np.stack([self._entries[i][0] for i in candidate_ids]) @ unit_vector
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.similarity_threshold:
+                self._entries.move_to_end(candidate_ids[best])
+                # Callers get their own copy so mutating it cannot corrupt the cache
+                hit = copy.deepcopy(self._entries[candidate_ids[best]][1])
+
+        if hit is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return hit
+
+    def get(self, query_vector: List[float], *key: Any) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up cached results for a query vector.
+
+        Args:
+            query_vector: Query embedding
+            key: Extra search parameters the results depend on (e.g. limit, filters)
+
+        Returns:
+            Cached results on a hit, otherwise None
+        """
+        return self.get_many([query_vector], *key)[0]
+
+    def get_many(self, query_vectors: List[List[float]], *key: Any) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Look up cached results for several query vectors at once.
+
+        Normalization and band keys for the whole batch are computed with a
+        single matrix multiplication instead of one projection per query.
+
+        Args:
+            query_vectors: Query embeddings
+            key: Extra search parameters the results depend on (e.g. limit, filters)
+
+        Returns:
+            Cached results or None for each query vector, in the same order
+        """
+        if not query_vectors:
+            return []
+
+        unit_vectors = self._normalize_many(query_vectors)
+        band_keys = self._band_keys(unit_vectors)
+
+        with self._lock:
+            return [self._lookup(unit_vector, keys, key) for unit_vector, keys in zip(unit_vectors, band_keys)]
+
+    def put(self, query_vector: List[float], results: List[Dict[str, Any]], *key: Any,
+            generation: Optional[int] = None) -> None:
+        """
+        Store results for a query vector.
+
+        Args:
+            query_vector: Query embedding
+            results: Search results to cache
+            key: Extra search parameters the results depend on (e.g. limit, filters)
+            generation: Value of `generation` read before the search; the results are
+                dropped if the cache was cleared since, as they may predate the change
+        """
+        unit_vector = self._normalize_many([query_vector])[0]
+        band_keys = tuple(self._band_keys(unit_vector[np.newaxis])[0].tolist())
+        # Keep a private copy, since the caller goes on to return and possibly mutate its results
+        results = copy.deepcopy(results)
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            entry_id = next(self._ids)
+            self._entries[entry_id] = (unit_vector, results, band_keys, key)
+            for table, band_key in zip(self._tables, band_keys):
+                table.setdefault((band_key, key), set()).add(entry_id)
+
+            # Evict least recently used entries beyond the size limit
+            while len(self._entries) > self.max_entries:
+                self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        """Drop the least recently used entry from the entries and band tables (lock must be held)."""
+        entry_id, (_, _, band_keys, key) = self._entries.popitem(last=False)
+        for table, band_key in zip(self._tables, band_keys):
+            bucket = table.get((band_key, key))
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del table[(band_key, key)]
+
+    def clear(self):
+        """Drop all cached results, e.g. after the corpus or selection changes."""
+        with self._lock:
+            self._entries.clear()
+            for table in self._tables:
+                table.clear()
+            self._generation += 1
+        logger.info("🗑️ Semantic search cache cleared")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics for monitoring."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "similarity_threshold": self.similarity_threshold
+            }
@@ -16,12 +16,12 @@ Following the Four Rules of Simple Design:
 """
 
 import os
-import json
+import orjson
 import hashlib
 import subprocess
 import sys
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from services.quality_score_service import QualityScoreService
 from config.settings import (
     CHUNK_SIZE, CHUNK_OVERLAP, CHUNK_STRATEGY, RETRIEVAL_METHOD,
@@ -31,11 +31,35 @@ from logging_config import setup_logging
 
 logger = setup_logging(__name__)
 
+# Resolve static paths once at import time
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LEGACY_RESULTS_FILE = os.path.join(BACKEND_DIR, 'experiment_results.json')
+
+
+def _get_git_commit() -> str:
+    """Get the short git commit hash of the running code, or 'N/A' outside a git checkout."""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], 
+            cwd=BACKEND_DIR,
+            stderr=subprocess.DEVNULL,
+            text=True
+        ).strip()[:8]  # Get first 8 characters
+    except Exception:
+        return 'N/A'
+
+
+# The code does not change under a running process, so spawn git only once
+GIT_COMMIT = _get_git_commit()
+
 
 class ExperimentService:
     """Service for experiment data management and processing."""
     
-    def __init__(self):
+    def __init__(self, doc_processor=None):
+        # Shared document processor; created lazily only when none is provided
+        self._doc_processor = doc_processor
+        
         # Use environment variable for experiments folder, fallback to relative path
         experiments_folder = os.getenv("EXPERIMENTS_FOLDER", "experiments/")
         if experiments_folder.startswith("/"):
@@ -43,23 +67,18 @@ class ExperimentService:
         else:
             self.experiments_folder = os.path.join(os.getcwd(), experiments_folder)
         
+    def _get_doc_processor(self):
+        """Get the shared document processor, creating one on first use if none was provided."""
+        if self._doc_processor is None:
+            from unified_document_processor import UnifiedDocumentProcessor
+            self._doc_processor = UnifiedDocumentProcessor()
+        return self._doc_processor
+
     def _get_environment_info(self) -> Dict[str, Any]:
         """Get environment information for reproducibility."""
-        try:
-            # Get git commit hash from the project root
-            project_root = os.path.dirname(os.path.dirname(__file__))
-            git_commit = subprocess.check_output(
-                ['git', 'rev-parse', 'HEAD'], 
-                cwd=project_root,
-                stderr=subprocess.DEVNULL,
-                text=True
-            ).strip()[:8]  # Get first 8 characters
-        except:
-            git_commit = 'N/A'
-            
         return {
             "python_version": sys.version,
-            "git_commit": git_commit,
+            "git_commit": GIT_COMMIT,
             "timestamp": datetime.now().isoformat(),
             "environment_variables": self._get_environment_variables()
         }
@@ -67,8 +86,7 @@ class ExperimentService:
     def _get_corpus_info(self) -> Dict[str, Any]:
         """Get comprehensive corpus information from available data."""
         try:
-            from unified_document_processor import UnifiedDocumentProcessor
-            doc_processor = UnifiedDocumentProcessor()
+            doc_processor = self._get_doc_processor()
             corpus_stats = doc_processor.get_unified_status()
             
             # Get actual document types from data folder
@@ -412,16 +430,27 @@ class ExperimentService:
             timestamp = datetime.now()
             return f"RAG Assessment - {timestamp.strftime('%Y-%m-%d %H:%M')}"
         
-    def save_experiment_results(self, results: List[Dict[str, Any]], config: Dict[str, Any] = None) -> str:
-        """Save experiment results to a timestamped JSON file in experiments folder with comprehensive metadata."""
+    @staticmethod
+    def build_experiment_filename(timestamp: datetime) -> str:
+        """Build the experiment filename used when saving results at the given timestamp."""
+        return f"experiment_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
+
+    def save_experiment_results(self, results: List[Dict[str, Any]], config: Dict[str, Any] = None, timestamp: datetime = None) -> Tuple[str, Dict[str, Any]]:
+        """
+        Save experiment results to a timestamped JSON file in experiments folder with comprehensive metadata.
+        
+        Returns:
+            The saved filename and the experiment metadata, so callers need not re-read the file;
+            ("", {}) if saving failed
+        """
         try:
             # Create experiments folder if it doesn't exist
             os.makedirs(self.experiments_folder, exist_ok=True)
             
             # Generate timestamp and experiment ID
-            timestamp = datetime.now()
+            timestamp = timestamp or datetime.now()
             experiment_id = f"exp_{timestamp.strftime('%Y%m%d_%H%M%S')}"
-            filename = f"experiment_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
+            filename = self.build_experiment_filename(timestamp)
             results_file = os.path.join(self.experiments_folder, filename)
             
             # Calculate basic metrics
@@ -432,8 +461,7 @@ class ExperimentService:
             selected_documents = []
             selected_chunks_count = 0
             try:
-                from unified_document_processor import UnifiedDocumentProcessor
-                doc_processor = UnifiedDocumentProcessor()
+                doc_processor = self._get_doc_processor()
                 corpus_status = doc_processor.get_unified_status()
                 
                 # Get selected documents from the selection manager
@@ -447,11 +475,9 @@ class ExperimentService:
                     
                     # Calculate total chunks for selected documents
                     try:
-                        from managers.enhanced_qdrant_manager import EnhancedQdrantManager
-                        from config.settings import COLLECTION_NAMES
                         from qdrant_client import models
                         
-                        qdrant_manager = EnhancedQdrantManager(COLLECTION_NAMES['DEFAULT_COLLECTION'])
+                        qdrant_manager = doc_processor.qdrant_manager
                         
                         # Count chunks where is_selected=True
                         try:
@@ -541,18 +567,19 @@ class ExperimentService:
                 "environment": self._get_environment_info()
             }
             
-            with open(results_file, 'w', encoding='utf-8') as f:
-                json.dump(experiment_data, f, indent=2, ensure_ascii=False)
+            # orjson encodes straight to one bytes buffer; OPT_SERIALIZE_NUMPY accepts NumPy scalars from metric code
+            with open(results_file, 'wb') as f:
+                f.write(orjson.dumps(experiment_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
             
             logger.info(f"💾 Saved {len(results)} experiment results to {filename}")
             logger.info(f"📊 Experiment ID: {experiment_id}")
             if timing_data:
                 logger.info(f"⏱️ Experiment duration: {timing_data.get('duration_seconds', 0):.2f} seconds")
-            return filename
+            return filename, experiment_data["metadata"]
             
         except Exception as e:
             logger.error(f"❌ Failed to save experiment results: {e}")
-            return ""
+            return "", {}
 
     def load_experiment_results(self, filename: str = None) -> List[Dict[str, Any]]:
         """Load experiment results from JSON file."""
@@ -574,14 +601,14 @@ class ExperimentService:
                         logger.info(f"📂 Loading most recent experiment: {most_recent}")
                     else:
                         # Fallback to old location for backward compatibility
-                        results_file = os.path.join(os.path.dirname(__file__), '..', 'experiment_results.json')
+                        results_file = LEGACY_RESULTS_FILE
                 else:
                     # Fallback to old location for backward compatibility
-                    results_file = os.path.join(os.path.dirname(__file__), '..', 'experiment_results.json')
+                    results_file = LEGACY_RESULTS_FILE
             
             if os.path.exists(results_file):
-                with open(results_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(results_file, 'rb') as f:
+                    data = orjson.loads(f.read())
                 
                 # Handle both old format (direct results) and new format (with metadata)
                 if isinstance(data, list):
@@ -607,8 +634,8 @@ class ExperimentService:
                 if filename.endswith('.json'):
                     filepath = os.path.join(self.experiments_folder, filename)
                     try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
+                        with open(filepath, 'rb') as f:
+                            data = orjson.loads(f.read())
                         
                         # Extract metadata
                         if isinstance(data, dict) and "metadata" in data:
@@ -741,37 +768,33 @@ class ExperimentService:
         """
         groups = {}
         
+        # Single pass: append each score to its source and role distributions
         for q in per_question_results:
-            source = q["source"]
-            role_name = q.get("role_name", "Unknown")
-            
-            if source not in groups:
-                groups[source] = {
+            quality_score = q["quality_score"]
+            group = groups.get(q["source"])
+            if group is None:
+                group = groups[q["source"]] = {
                     "avg_quality_score": 0,
                     "distribution": [],
                     "roles": {}
                 }
+            group["distribution"].append(quality_score)
             
-            groups[source]["distribution"].append(q["quality_score"])
-            
-            if role_name not in groups[source]["roles"]:
-                groups[source]["roles"][role_name] = {
+            role_name = q.get("role_name", "Unknown")
+            role_data = group["roles"].get(role_name)
+            if role_data is None:
+                role_data = group["roles"][role_name] = {
                     "avg_quality_score": 0,
                     "distribution": []
                 }
-                
-            groups[source]["roles"][role_name]["distribution"].append(q["quality_score"])
-            logger.debug(f"Added {source} question with role '{role_name}' to groups")
-
+            role_data["distribution"].append(quality_score)
+        
         for source, data in groups.items():
-            if data["distribution"]:
-                # Average the quality scores directly
-                data["avg_quality_score"] = round(sum(data["distribution"]) / len(data["distribution"]), 1)
-            
-            for role_name, role_data in data["roles"].items():
-                if role_data["distribution"]:
-                    # Average the quality scores directly
-                    role_data["avg_quality_score"] = round(sum(role_data["distribution"]) / len(role_data["distribution"]), 1)
+            # Average the quality scores directly (every group and role has at least one score)
+            data["avg_quality_score"] = round(sum(data["distribution"]) / len(data["distribution"]), 1)
+            for role_data in data["roles"].values():
+                role_data["avg_quality_score"] = round(sum(role_data["distribution"]) / len(role_data["distribution"]), 1)
+            logger.debug("Grouped %d %s questions across %d roles", len(data['distribution']), source, len(data['roles']))
                     
         return groups
 
@@ -789,9 +812,9 @@ class ExperimentService:
         """
         # Average the quality scores directly (they were already calculated correctly)
         all_quality_scores = [q["quality_score"] for q in per_question_results]
-        avg_quality_score = round(sum(all_quality_scores) / len(all_quality_scores), 1)
-        all_quality_scores = [q["quality_score"] for q in per_question_results]
-        success_rate = QualityScoreService.calculate_success_rate(all_quality_scores)
+        score_summary = QualityScoreService.summarize_quality_scores(all_quality_scores)
+        avg_quality_score = score_summary["avg_quality_score"]
+        success_rate = score_summary["success_rate"]
         
 
         
@@ -901,11 +924,9 @@ class ExperimentService:
             # Fallback: try to get from Qdrant (for backward compatibility)
             total_chunks = 0
             try:
-                from managers.enhanced_qdrant_manager import EnhancedQdrantManager
-                from config.settings import COLLECTION_NAMES
                 from qdrant_client import models
                 
-                qdrant_manager = EnhancedQdrantManager(COLLECTION_NAMES['DEFAULT_COLLECTION'])
+                qdrant_manager = self._get_doc_processor().qdrant_manager
                 
                 # First, let's check if the is_selected field exists by getting a sample point
                 try:
@@ -989,8 +1010,7 @@ class ExperimentService:
                 logger.warning(f"Could not get selected chunks count from Qdrant: {e}")
                 # Fallback: try unified processor
                 try:
-                    from unified_document_processor import UnifiedDocumentProcessor
-                    doc_processor = UnifiedDocumentProcessor()
+                    doc_processor = self._get_doc_processor()
                     corpus_stats = doc_processor.get_unified_status()
                     total_chunks = corpus_stats.get("chunk_count", 0)
                     logger.info(f"📊 Retrieved total chunks from unified processor: {total_chunks}")
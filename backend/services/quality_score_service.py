@@ -17,6 +17,7 @@ Following the Four Rules of Simple Design:
 """
 
 from typing import List, Dict, Any, Literal
+import numpy as np
 from config.settings import QUALITY_THRESHOLDS
 
 QualityStatus = Literal['good', 'developing', 'poor']
@@ -91,6 +92,27 @@ class QualityScoreService:
         good_scores = [s for s in quality_scores if s >= QUALITY_THRESHOLDS['GOOD']]
         return len(good_scores) / len(quality_scores)
     
+    @staticmethod
+    def summarize_quality_scores(quality_scores: List[float]) -> Dict[str, float]:
+        """
+        Calculate average quality score and success rate in one vectorized pass.
+        
+        Args:
+            quality_scores: List of quality scores
+            
+        Returns:
+            Dictionary with avg_quality_score (rounded to 1 decimal place)
+            and success_rate (between 0 and 1)
+        """
+        if not quality_scores:
+            return {"avg_quality_score": 0.0, "success_rate": 0.0}
+        
+        scores = np.asarray(quality_scores, dtype=np.float64)
+        return {
+            "avg_quality_score": round(float(scores.mean()), 1),
+            "success_rate": np.count_nonzero(scores >= QUALITY_THRESHOLDS['GOOD']) / scores.size
+        }
+    
 
     
     @staticmethod
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test script to verify semantic cache hits for near-duplicate queries
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import numpy as np
+
+from managers.semantic_cache import SemanticCache
+from config.settings import VECTOR_DB_CONFIG, SEMANTIC_CACHE_CONFIG
+
+DIMENSION = VECTOR_DB_CONFIG['VECTOR_SIZE']
+TRIALS = 200
+
+
+def make_cache(**overrides) -> SemanticCache:
+    """Build a cache with the production settings"""
+    options = dict(
+        dimension=DIMENSION,
+        num_bands=SEMANTIC_CACHE_CONFIG['NUM_BANDS'],
+        bits_per_band=SEMANTIC_CACHE_CONFIG['BITS_PER_BAND'],
+        similarity_threshold=SEMANTIC_CACHE_CONFIG['SIMILARITY_THRESHOLD'],
+        max_entries=SEMANTIC_CACHE_CONFIG['MAX_ENTRIES'],
+        seed=SEMANTIC_CACHE_CONFIG['SEED']
+    )
+    options.update(overrides)
+    return SemanticCache(**options)
+
+
+def near_duplicate(vector: np.ndarray, cosine: float, rng: np.random.Generator) -> np.ndarray:
+    """Return a unit vector at exactly the given cosine similarity to `vector`"""
+    unit = vector / np.linalg.norm(vector)
+    noise = rng.standard_normal(len(unit))
+    noise -= (noise @ unit) * unit
+    noise /= np.linalg.norm(noise)
+    return cosine * unit + np.sqrt(1 - cosine ** 2) * noise
+
+
+def test_near_duplicate_hits():
+    """Queries just above the similarity threshold should be served from the cache"""
+    rng = np.random.default_rng(0)
+    cache = make_cache()
+    hits = 0
+    for trial in range(TRIALS):
+        query = rng.standard_normal(DIMENSION)
+        cache.put(query.tolist(), [{"id": trial}], 5, True)
+        cached = cache.get(near_duplicate(query, 0.97, rng).tolist(), 5, True)
+        hits += cached == [{"id": trial}]
+    print(f"   Near-duplicate hits: {hits}/{TRIALS}")
+    assert hits >= TRIALS * 0.98
+
+
+def test_unrelated_query_misses():
+    """Unrelated queries and queries with different search parameters should miss"""
+    rng = np.random.default_rng(1)
+    cache = make_cache()
+    for trial in range(TRIALS):
+        cache.put(rng.standard_normal(DIMENSION).tolist(), [{"id": trial}], 5, True)
+
+    unrelated_hits = sum(
+        cache.get(rng.standard_normal(DIMENSION).tolist(), 5, True) is not None
+        for _ in range(TRIALS)
+    )
+    print(f"   Unrelated hits: {unrelated_hits}/{TRIALS}")
+    assert unrelated_hits == 0
+
+    query = rng.standard_normal(DIMENSION)
+    cache.put(query.tolist(), [{"id": "limit"}], 5, True)
+    assert cache.get(query.tolist(), 5, True) == [{"id": "limit"}]
+    assert cache.get(query.tolist(), 10, True) is None
+
+
+def test_batch_lookup_and_eviction():
+    """Batch lookups match single lookups and evicted entries stop hitting"""
+    rng = np.random.default_rng(2)
+    cache = make_cache(max_entries=2)
+    queries = [rng.standard_normal(DIMENSION) for _ in range(3)]
+    for index, query in enumerate(queries):
+        cache.put(query.tolist(), [{"id": index}], 5, False)
+
+    results = cache.get_many([near_duplicate(q, 0.98, rng).tolist() for q in queries], 5, False)
+    assert results == [None, [{"id": 1}], [{"id": 2}]]
+    assert cache.get_stats()["entries"] == 2
+
+    cache.clear()
+    assert cache.get(queries[2].tolist(), 5, False) is None
+
+
+def test_put_after_clear_is_dropped():
+    """Results computed before a clear must not be cached after it"""
+    rng = np.random.default_rng(3)
+    cache = make_cache()
+    query = rng.standard_normal(DIMENSION).tolist()
+
+    generation = cache.generation
+    cache.clear()
+    cache.put(query, [{"id": "stale"}], 5, True, generation=generation)
+    assert cache.get(query, 5, True) is None
+
+    cache.put(query, [{"id": "fresh"}], 5, True, generation=cache.generation)
+    assert cache.get(query, 5, True) == [{"id": "fresh"}]
+
+
+def test_cached_results_are_copies():
+    """Mutating stored or returned results must not change what the cache serves"""
+    rng = np.random.default_rng(4)
+    cache = make_cache()
+    query = rng.standard_normal(DIMENSION).tolist()
+    results = [{"id": 1, "metadata": {"page": 1}}]
+
+    cache.put(query, results, 5, True)
+    results[0]["metadata"]["page"] = 99
+    cached = cache.get(query, 5, True)
+    cached.append({"id": 2})
+    assert cache.get(query, 5, True) == [{"id": 1, "metadata": {"page": 1}}]
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Semantic Cache...")
+    print()
+    tests = [test_near_duplicate_hits, test_unrelated_query_misses, test_batch_lookup_and_eviction,
+             test_put_after_clear_is_dropped, test_cached_results_are_copies]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"   ✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"   ❌ {test.__name__} {e}")
+    print()
+    print("🎉 All semantic cache tests passed!" if not failed else f"❌ {failed} test(s) failed")
+    sys.exit(1 if failed else 0)
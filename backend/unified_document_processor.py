@@ -2,6 +2,10 @@
 import os
 import logging
 import uuid
+import functools
+import threading
+import time
+from collections import OrderedDict
 from typing import List, Dict, Any
 from datetime import datetime
 from pathlib import Path
@@ -14,17 +18,40 @@ from managers.chunking_manager import ChunkingStrategyManager
 from managers.corpus_statistics_manager import CorpusStatisticsManager
 from managers.vector_store_manager import VectorStoreManager
 from managers.search_manager import SearchManager
+from managers.semantic_cache import SemanticCache
 
 # Import embeddings and config
 from langchain_openai import OpenAIEmbeddings
 from config.settings import (
     CHUNK_STRATEGY, CHUNK_SIZE, CHUNK_OVERLAP, 
-    COLLECTION_NAMES, ENV_DEFAULTS
+    COLLECTION_NAMES, ENV_DEFAULTS, VECTOR_DB_CONFIG, SEMANTIC_CACHE_CONFIG
 )
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+def invalidates_corpus_caches(method):
+    """Clear the search and status caches after a corpus or selection change, even if it fails."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.invalidate_caches()
+    return wrapper
+
+def holds_change_lock(method):
+    """
+    Run a selection config change under the processor's change lock. Endpoints call
+    these from worker threads, so the lock keeps concurrent changes from interleaving.
+    Only short changes take it; ingestion locks just the step that records its result.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._change_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class UnifiedDocumentProcessor:
     """
     Unified document processor that combines functionality from both 
@@ -58,6 +85,31 @@ class UnifiedDocumentProcessor:
         self._vector_store_manager = None
         self._search_manager = None
         
+        # Semantic cache of search results keyed by query embedding
+        self.semantic_cache = SemanticCache(
+            dimension=VECTOR_DB_CONFIG['VECTOR_SIZE'],
+            num_bands=SEMANTIC_CACHE_CONFIG['NUM_BANDS'],
+            bits_per_band=SEMANTIC_CACHE_CONFIG['BITS_PER_BAND'],
+            similarity_threshold=SEMANTIC_CACHE_CONFIG['SIMILARITY_THRESHOLD'],
+            max_entries=SEMANTIC_CACHE_CONFIG['MAX_ENTRIES'],
+            seed=SEMANTIC_CACHE_CONFIG['SEED']
+        )
+        
+        # Query text -> embedding, least recently used first; embeddings never go stale
+        self._query_embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._query_embedding_cache_size = SEMANTIC_CACHE_CONFIG['QUERY_EMBEDDING_CACHE_SIZE']
+        self._query_embedding_lock = threading.Lock()
+        
+        # Serializes selection config changes (reentrant: changes call each other)
+        self._change_lock = threading.RLock()
+        
+        # Last connected unified status and when it was built (time.monotonic)
+        self._unified_status_cache = None
+        self._unified_status_cached_at = 0.0
+        # One rebuild at a time; the generation drops rebuilds that raced an invalidation
+        self._unified_status_lock = threading.Lock()
+        self._unified_status_generation = 0
+        
         # State tracking
         self._documents_loaded = False
         self._embedding = None
@@ -104,11 +156,45 @@ class UnifiedDocumentProcessor:
     # UNIFIED STATUS METHODS (Combines both processors)
     # ============================================================================
 
+    def invalidate_caches(self):
+        """Drop cached search results and corpus status after the corpus or selection changes."""
+        self.semantic_cache.clear()
+        self._unified_status_generation += 1
+        self._unified_status_cache = None
+
     def get_unified_status(self) -> Dict[str, Any]:
         """
         Get comprehensive unified status including both corpus and selection information.
         This replaces both get_corpus_stats() and get_document_status().
+        Connected results are reused for a few seconds, since building them takes several Qdrant scans.
         """
+        cached_status = self._get_cached_unified_status()
+        if cached_status is not None:
+            return cached_status
+        
+        # Concurrent pollers wait for a single rebuild instead of each scanning Qdrant
+        with self._unified_status_lock:
+            cached_status = self._get_cached_unified_status()
+            if cached_status is not None:
+                return cached_status
+            
+            generation = self._unified_status_generation
+            unified_status = self._build_unified_status()
+            if unified_status["database_connected"] and generation == self._unified_status_generation:
+                self._unified_status_cache = unified_status
+                self._unified_status_cached_at = time.monotonic()
+            return dict(unified_status)
+
+    def _get_cached_unified_status(self):
+        """Return a copy of the cached unified status if it is still fresh, otherwise None."""
+        cached_status = self._unified_status_cache
+        if (cached_status is not None and
+                time.monotonic() - self._unified_status_cached_at < VECTOR_DB_CONFIG['STATUS_CACHE_TTL_SECONDS']):
+            return dict(cached_status)
+        return None
+
+    def _build_unified_status(self) -> Dict[str, Any]:
+        """Build the unified status from Qdrant, the selection manager and the data folder."""
         try:
             # Check database connectivity first
             database_connected = self._check_database_connectivity()
@@ -151,7 +237,7 @@ class UnifiedDocumentProcessor:
             # Determine if corpus is loaded based on chunk count
             corpus_loaded = qdrant_stats.get("total_chunks", 0) > 0
             
-            return {
+            unified_status = {
                 # Corpus statistics (from SimpleDocumentProcessor) - only selected documents
                 "corpus_loaded": corpus_loaded,
                 "document_count": selection_summary.get("selected_documents", 0),  # Only selected documents
@@ -172,6 +258,7 @@ class UnifiedDocumentProcessor:
                 "database_connected": database_connected,
                 "last_updated": datetime.now().isoformat()
             }
+            return unified_status
         except Exception as e:
             logger.error(f"❌ Failed to get unified status: {e}")
             return {
@@ -234,6 +321,8 @@ class UnifiedDocumentProcessor:
     # DOCUMENT MANAGEMENT METHODS (from EnhancedDocumentProcessor)
     # ============================================================================
 
+    @invalidates_corpus_caches
+    @holds_change_lock
     def select_document(self, filename: str) -> bool:
         """Select a document for ingestion."""
         try:
@@ -247,6 +336,8 @@ class UnifiedDocumentProcessor:
             logger.error(f"❌ Failed to select document {filename}: {e}")
             return False
 
+    @invalidates_corpus_caches
+    @holds_change_lock
     def deselect_document(self, filename: str) -> bool:
         """Deselect a document (retain vectors but exclude from search)."""
         try:
@@ -277,6 +368,7 @@ class UnifiedDocumentProcessor:
             logger.error(f"❌ Failed to deselect document {filename}: {e}")
             return False
 
+    @invalidates_corpus_caches
     def ingest_document(self, filename: str, progress_callback=None) -> bool:
         """Ingest a specific document into the vector store with progress tracking."""
         try:
@@ -348,16 +440,19 @@ class UnifiedDocumentProcessor:
                 except Exception as e:
                     logger.warning(f"⚠️ Progress callback failed: {e}")
             
-            # Add to Qdrant with selection status
-            is_selected = self.selection_manager.selection_config.get("documents", {}).get(filename, {}).get("is_selected", True)
-            success = self.qdrant_manager.add_documents_with_selection_status(
-                embedded_chunks, filename, is_selected
-            )
+            # Add to Qdrant with selection status; locked so a concurrent (de)selection
+            # cannot change the status between reading it and recording the ingestion
+            with self._change_lock:
+                is_selected = self.selection_manager.selection_config.get("documents", {}).get(filename, {}).get("is_selected", True)
+                success = self.qdrant_manager.add_documents_with_selection_status(
+                    embedded_chunks, filename, is_selected
+                )
+                
+                if success:
+                    # Mark as ingested in selection config
+                    self.selection_manager.mark_document_ingested(filename, len(embedded_chunks))
             
             if success:
-                # Mark as ingested in selection config
-                self.selection_manager.mark_document_ingested(filename, len(embedded_chunks))
-                
                 # Final progress callback
                 if progress_callback:
                     try:
@@ -380,6 +475,8 @@ class UnifiedDocumentProcessor:
             logger.error(f"❌ Failed to ingest document {filename}: {e}")
             return False
 
+    @invalidates_corpus_caches
+    @holds_change_lock
     def scan_and_update_documents(self) -> Dict[str, Any]:
         """Scan data folder and add new documents to the tracked list."""
         try:
@@ -418,6 +515,25 @@ class UnifiedDocumentProcessor:
             logger.error(f"❌ Failed to load documents: {e}")
             return {}
 
+    @invalidates_corpus_caches
+    @holds_change_lock
+    def add_document_to_tracking(self, filename: str) -> bool:
+        """Start tracking a newly uploaded document (not selected by default)."""
+        return self.selection_manager.add_document_to_tracking(filename)
+
+    @invalidates_corpus_caches
+    @holds_change_lock
+    def remove_document_from_tracking(self, filename: str) -> bool:
+        """Stop tracking a deleted document."""
+        return self.selection_manager.remove_document_from_tracking(filename)
+
+    @invalidates_corpus_caches
+    @holds_change_lock
+    def reload_selection_config(self) -> None:
+        """Reload the document selection config from disk, discarding in-memory state."""
+        self.selection_manager.selection_config = self.selection_manager._load_selection_config()
+
+    @invalidates_corpus_caches
     def ingest_pending_documents(self) -> bool:
         """Ingest all pending documents."""
         try:
@@ -426,6 +542,7 @@ class UnifiedDocumentProcessor:
             logger.error(f"❌ Failed to ingest pending documents: {e}")
             return False
 
+    @invalidates_corpus_caches
     def reingest_changed_documents(self) -> bool:
         """Re-ingest documents that have changed."""
         try:
@@ -434,18 +551,20 @@ class UnifiedDocumentProcessor:
             logger.error(f"❌ Failed to re-ingest changed documents: {e}")
             return False
 
+    @invalidates_corpus_caches
     def force_rebuild_collection(self) -> bool:
         """Force rebuild the entire collection."""
         try:
             logger.warning("⚠️ Force rebuilding collection - this will delete all existing data")
             
-            # Delete and recreate collection
-            self.qdrant_manager.delete_collection_chunks()
-            self.qdrant_manager._ensure_collection_exists()
+            # Drop and recreate the collection in one step instead of deleting points one filter at a time
+            if not self.qdrant_manager.recreate_collection():
+                return False
             
             # Reset all documents as not ingested
-            for filename in self.selection_manager.selection_config.get("documents", {}):
-                self.selection_manager.selection_config["documents"][filename]["is_ingested"] = False
+            with self._change_lock:
+                for filename in self.selection_manager.selection_config.get("documents", {}):
+                    self.selection_manager.selection_config["documents"][filename]["is_ingested"] = False
             
             # Ingest all selected documents
             return self._ingest_pending_documents()
@@ -453,11 +572,56 @@ class UnifiedDocumentProcessor:
             logger.error(f"❌ Failed to force rebuild collection: {e}")
             return False
 
-    def search_documents(self, query: str, limit: int = 10, filter_selected: bool = True) -> List[Dict[str, Any]]:
-        """Search documents with optional selection filter."""
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        Embed query texts, reusing embeddings of previously seen queries.
+        Only uncached queries are sent to the embedding model, in a single request.
+        """
+        keys = [query.strip() for query in queries]
+        embeddings: List[Any] = [None] * len(keys)
+        
+        with self._query_embedding_lock:
+            for i, key in enumerate(keys):
+                cached_embedding = self._query_embedding_cache.get(key)
+                if cached_embedding is not None:
+                    self._query_embedding_cache.move_to_end(key)
+                    embeddings[i] = cached_embedding
+        
+        miss_keys = list(dict.fromkeys(key for key, embedding in zip(keys, embeddings) if embedding is None))
+        if miss_keys:
+            new_embeddings = dict(zip(miss_keys, self.embedding.embed_documents(miss_keys)))
+            with self._query_embedding_lock:
+                for key, embedding in new_embeddings.items():
+                    self._query_embedding_cache[key] = embedding
+                    self._query_embedding_cache.move_to_end(key)
+                while len(self._query_embedding_cache) > self._query_embedding_cache_size:
+                    self._query_embedding_cache.popitem(last=False)
+            embeddings = [new_embeddings[key] if embedding is None else embedding
+                          for key, embedding in zip(keys, embeddings)]
+        
+        return embeddings
+
+    def search_documents(self, query: str, limit: int = 10, filter_selected: bool = True,
+                         use_semantic_cache: bool = False) -> List[Dict[str, Any]]:
+        """
+        Search documents with optional selection filter.
+        
+        The semantic cache answers near-duplicate queries with another query's results, so it is
+        opt-in for interactive searches and stays off for experiments, whose scores must be exact.
+        """
         try:
             # Get query embedding
-            query_embedding = self.embedding.embed_query(query)
+            query_embedding = self.embed_queries([query])[0]
+            
+            # Skip caching if the caches are invalidated while this search runs
+            generation = self.semantic_cache.generation
+            
+            # Reuse results of an equivalent earlier query when available
+            if use_semantic_cache:
+                cached_results = self.semantic_cache.get(query_embedding, limit, filter_selected)
+                if cached_results is not None:
+                    logger.info(f"🚀 Semantic cache hit, returning {len(cached_results)} cached results")
+                    return cached_results
             
             # Search with selection filter
             raw_results = self.qdrant_manager.search_with_selection_filter(
@@ -465,25 +629,9 @@ class UnifiedDocumentProcessor:
             )
             
             # Transform results to expected format
-            results = []
-            for result in raw_results:
-                # Convert score to similarity (Qdrant returns cosine similarity as score)
-                similarity = result.get("score", 0.0)
-                
-                # Get document source for title
-                document_source = result.get("document_source", "")
-                title = document_source if document_source else "Unknown Document"
-                
-                transformed_result = {
-                    "doc_id": result.get("id", ""),
-                    "chunk_id": result.get("chunk_id", ""),
-                    "content": result.get("content", ""),
-                    "similarity": similarity,
-                    "title": title,
-                    "metadata": result.get("metadata", {}),
-                    "document_source": document_source
-                }
-                results.append(transformed_result)
+            results = [self._transform_search_result(result) for result in raw_results]
+            if use_semantic_cache and results:
+                self.semantic_cache.put(query_embedding, results, limit, filter_selected, generation=generation)
             
             logger.info(f"🔍 Search returned {len(results)} results")
             return results
@@ -491,6 +639,66 @@ class UnifiedDocumentProcessor:
             logger.error(f"❌ Search failed: {e}")
             return []
 
+    def search_documents_batch(self, queries: List[str], limit: int = 10, filter_selected: bool = True,
+                               use_semantic_cache: bool = False) -> List[List[Dict[str, Any]]]:
+        """
+        Search several queries at once: one embedding request and one Qdrant round-trip.
+        Returns one result list per query, in the same order as the queries.
+        The semantic cache is opt-in, as for search_documents.
+        """
+        if not queries:
+            return []
+        try:
+            # Embed all uncached queries in a single request
+            query_embeddings = self.embed_queries(queries)
+            
+            # Skip caching if the caches are invalidated while this search runs
+            generation = self.semantic_cache.generation
+            
+            # Serve equivalent earlier queries from the semantic cache
+            if use_semantic_cache:
+                results = self.semantic_cache.get_many(query_embeddings, limit, filter_selected)
+            else:
+                results = [None] * len(queries)
+            miss_indexes = [i for i, cached_results in enumerate(results) if cached_results is None]
+            
+            if miss_indexes:
+                # Search the remaining embeddings with selection filter in one batch
+                raw_batches = self.qdrant_manager.search_batch_with_selection_filter(
+                    [query_embeddings[i] for i in miss_indexes], limit, filter_selected
+                )
+                for i, raw_results in zip(miss_indexes, raw_batches):
+                    results[i] = [self._transform_search_result(result) for result in raw_results]
+                    if use_semantic_cache and results[i]:
+                        self.semantic_cache.put(query_embeddings[i], results[i], limit, filter_selected,
+                                                generation=generation)
+            
+            logger.info(f"🔍 Batch search returned results for {len(results)} queries ({len(queries) - len(miss_indexes)} from cache)")
+            return results
+        except Exception as e:
+            logger.error(f"❌ Batch search failed: {e}")
+            return [[] for _ in queries]
+
+    @staticmethod
+    def _transform_search_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Transform a raw Qdrant search result into the API result format."""
+        # Convert score to similarity (Qdrant returns cosine similarity as score)
+        similarity = result.get("score", 0.0)
+        
+        # Get document source for title
+        document_source = result.get("document_source", "")
+        title = document_source if document_source else "Unknown Document"
+        
+        return {
+            "doc_id": result.get("id", ""),
+            "chunk_id": result.get("chunk_id", ""),
+            "content": result.get("content", ""),
+            "similarity": similarity,
+            "title": title,
+            "metadata": result.get("metadata", {}),
+            "document_source": document_source
+        }
+
     # ============================================================================
     # LEGACY METHODS (from SimpleDocumentProcessor) for backward compatibility
     # ============================================================================
@@ -739,6 +947,8 @@ class UnifiedDocumentProcessor:
             logger.error(f"❌ Failed to ingest pending documents: {e}")
             return False
 
+    @invalidates_corpus_caches
+    @holds_change_lock
     def refresh_chunk_selection_status(self) -> bool:
         """Force refresh the selection status of all chunks in Qdrant."""
         try:
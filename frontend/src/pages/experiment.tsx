@@ -236,7 +236,8 @@ const ExperimentConfiguration: React.FC = () => {
     websocket.onopen = () => {
       clearTimeout(connectionTimeout);
       console.log('🔌 WebSocket connected, sending config...');
-      websocket.send(JSON.stringify(config));
+      // Vercel mode saves results from the stream, so it needs full chunk content; locally the backend saves them
+      websocket.send(JSON.stringify({ ...config, include_content: isVercelDeployment() }));
     };
 
     websocket.onmessage = (event) => {
@@ -282,6 +283,15 @@ const ExperimentConfiguration: React.FC = () => {
           }
           
           websocket.close();
+        } else if (data.type === 'batch') {
+          // A batch of question results together with its progress update
+          const transformedResults = data.results.map((result: any) => ({
+            ...result,
+            avg_quality_score: result.avg_quality_score || result.avg_similarity,
+          }));
+          console.log(`📊 Received ${transformedResults.length} results:`, transformedResults);
+          setResults(prevResults => [...prevResults, ...transformedResults]);
+          setProgress(data.progress);
         } else if (data.type === 'progress') {
           // Handle progress updates
           console.log('📊 Progress update:', data);
@@ -46,6 +46,7 @@ export interface ExperimentConfig {
   selected_groups: string[];
   top_k: number;
   similarity_threshold: number;
+  include_content?: boolean;
 }
 
 export interface QuestionResult {